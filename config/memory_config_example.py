@@ -1,47 +1,39 @@
 """Memory configuration example for the dashboard."""
 
+from typing import Final
+
 from src.modular_dashboard.config.memory_config import MemoryConfig
 
 # Example memory configuration for production use
-PRODUCTION_MEMORY_CONFIG = MemoryConfig(
+PRODUCTION_MEMORY_CONFIG: Final[MemoryConfig] = MemoryConfig(
     max_cache_size=1000,  # Maximum 1000 cached items
     cache_ttl_seconds=3600,  # Cache expires after 1 hour
     max_memory_mb=512,  # Maximum 512MB memory usage
-    compression_enabled=True,  # Enable compression for large objects
-    compression_threshold_kb=100,  # Compress objects >100KB
+    enable_compression=True,  # Enable compression for large objects
     cleanup_interval_seconds=300,  # Clean up every 5 minutes
-    enable_memory_monitoring=True,  # Enable memory monitoring
-    enable_weak_references=True,  # Use weak references for cache
-    memory_warning_threshold_mb=400,  # Warning at 400MB usage
-    memory_error_threshold_mb=450,  # Error at 450MB usage
+    enable_weak_refs=True,  # Use weak references for cache
+    memory_threshold_percent=80,  # Trigger cleanup at 80% memory usage
 )
 
 # Example memory configuration for development use
-DEVELOPMENT_MEMORY_CONFIG = MemoryConfig(
+DEVELOPMENT_MEMORY_CONFIG: Final[MemoryConfig] = MemoryConfig(
     max_cache_size=100,  # Smaller cache for development
     cache_ttl_seconds=300,  # Shorter TTL for testing
     max_memory_mb=128,  # Lower memory limit
-    compression_enabled=False,  # Disable compression for easier debugging
-    compression_threshold_kb=1000,  # Higher threshold
+    enable_compression=False,  # Disable compression for easier debugging
     cleanup_interval_seconds=60,  # More frequent cleanup
-    enable_memory_monitoring=True,
-    enable_weak_references=True,
-    memory_warning_threshold_mb=100,
-    memory_error_threshold_mb=120,
+    enable_weak_refs=True,
+    debug_memory_usage=True,  # Log memory usage while developing
 )
 
 # Example memory configuration for testing (minimal)
-TEST_MEMORY_CONFIG = MemoryConfig(
+TEST_MEMORY_CONFIG: Final[MemoryConfig] = MemoryConfig(
     max_cache_size=10,
     cache_ttl_seconds=30,
     max_memory_mb=32,
-    compression_enabled=False,
-    compression_threshold_kb=1000,
+    enable_compression=False,
     cleanup_interval_seconds=10,
-    enable_memory_monitoring=True,
-    enable_weak_references=False,  # Disable weak references for testing
-    memory_warning_threshold_mb=25,
-    memory_error_threshold_mb=30,
+    enable_weak_refs=False,  # Disable weak references for testing
 )
 
 # Usage example in config.yaml:
@@ -49,10 +41,7 @@ TEST_MEMORY_CONFIG = MemoryConfig(
 #   max_cache_size: 1000
 #   cache_ttl_seconds: 3600
 #   max_memory_mb: 512
-#   compression_enabled: true
-#   compression_threshold_kb: 100
+#   enable_compression: true
 #   cleanup_interval_seconds: 300
-#   enable_memory_monitoring: true
-#   enable_weak_references: true
-#   memory_warning_threshold_mb: 400
-#   memory_error_threshold_mb: 450
+#   enable_weak_refs: true
+#   memory_threshold_percent: 80
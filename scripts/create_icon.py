@@ -3,10 +3,16 @@
 Create a simple placeholder icon for the application.
 """
 
+import io
+from pathlib import Path
+
 from PIL import Image, ImageDraw
 
+ICON_PATH = Path("src/modular_dashboard/assets/app.iconset/icon_256x256.png")
 
-def create_icon():
+
+def render_icon() -> bytes:
+    """Render the placeholder icon and return it as PNG bytes."""
     # Create a 256x256 image
     img = Image.new("RGB", (256, 256), color=(65, 105, 225))  # Royal blue background
 
@@ -28,11 +34,22 @@ def create_icon():
             y = 70 + i * 40
             draw.ellipse([x - 5, y - 5, x + 5, y + 5], fill=(65, 105, 225))
 
-    # Save the image
-    img.save("src/modular_dashboard/assets/app.iconset/icon_256x256.png")
-    print(
-        "Created placeholder icon at src/modular_dashboard/assets/app.iconset/icon_256x256.png"
-    )
+    buffer = io.BytesIO()
+    img.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def create_icon():
+    data = render_icon()
+
+    # The output is deterministic; leave an identical file untouched so its
+    # mtime doesn't invalidate downstream iconset/packaging steps
+    if ICON_PATH.exists() and ICON_PATH.read_bytes() == data:
+        print(f"Placeholder icon at {ICON_PATH} is up to date")
+        return
+
+    ICON_PATH.write_bytes(data)
+    print(f"Created placeholder icon at {ICON_PATH}")
 
 
 if __name__ == "__main__":
@@ -5,7 +5,12 @@ This is a placeholder implementation - in a real scenario, you would integrate
 with a translation API like Google Translate, DeepL, or OpenAI.
 """
 
-import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+DOCS_DIR = Path("/Volumes/Work/DevSpace/01_APP/ModularDashboard/docs")
+EN_DOCS_DIR = DOCS_DIR / "en"
 
 # Dictionary mapping Chinese terms to English translations
 translations = {
@@ -54,39 +59,60 @@ translations = {
     "有关开发相关的问题，请参阅 [开发](./development/index.md) 部分。": "For development-related questions, see the [Development](./development/index.md) section.",
 }
 
+# Terms ordered longest first so that a short term never shadows a longer one
+# sharing its prefix (e.g. "模块" vs "模块基类")
+_SORTED_TRANSLATIONS = sorted(
+    translations.items(), key=lambda item: len(item[0]), reverse=True
+)
+
+# Single-character terms go through str.translate; everything else is
+# matched by one alternation in a single pass over the content
+_CHAR_TABLE = {
+    ord(chinese): english
+    for chinese, english in _SORTED_TRANSLATIONS
+    if len(chinese) == 1
+}
+_TRANSLATION_PATTERN = re.compile(
+    "|".join(
+        re.escape(chinese)
+        for chinese, _english in _SORTED_TRANSLATIONS
+        if len(chinese) > 1
+    )
+)
+
+
+def _translate_match(match):
+    return translations[match.group(0)]
 
-def translate_file(file_path):
+
+def translate_file(file_path: Path):
     """Translate a single file from Chinese to English."""
-    with open(file_path, encoding="utf-8") as f:
-        content = f.read()
+    content = file_path.read_text(encoding="utf-8")
 
-    # Simple replacement-based translation
-    for chinese, english in translations.items():
-        content = content.replace(chinese, english)
+    # Replacement-based translation in a single pass over the content
+    content = _TRANSLATION_PATTERN.sub(_translate_match, content)
+    # Single characters last, so they can't split a longer term
+    if _CHAR_TABLE:
+        content = content.translate(_CHAR_TABLE)
 
     # Write translated content to the English directory
-    en_file_path = file_path.replace("/docs/", "/docs/en/")
-    os.makedirs(os.path.dirname(en_file_path), exist_ok=True)
-
-    with open(en_file_path, "w", encoding="utf-8") as f:
-        f.write(content)
+    en_file_path = EN_DOCS_DIR / file_path.relative_to(DOCS_DIR)
+    en_file_path.parent.mkdir(parents=True, exist_ok=True)
+    en_file_path.write_text(content, encoding="utf-8")
 
     print(f"Translated {file_path} -> {en_file_path}")
 
 
 def main():
     """Main function to translate all documentation files."""
-    docs_dir = "/Volumes/Work/DevSpace/01_APP/ModularDashboard/docs"
-
     # Skip the 'en' directory itself
-    for root, _dirs, files in os.walk(docs_dir):
-        if "/docs/en/" in root:
-            continue
-
-        for file in files:
-            if file.endswith(".md"):
-                file_path = os.path.join(root, file)
-                translate_file(file_path)
+    file_paths = [
+        path for path in DOCS_DIR.rglob("*.md") if not path.is_relative_to(EN_DOCS_DIR)
+    ]
+
+    # Translation is cheap now, so overlap the file I/O
+    with ThreadPoolExecutor() as executor:
+        list(executor.map(translate_file, file_paths))
 
 
 if __name__ == "__main__":
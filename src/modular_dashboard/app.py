@@ -1,10 +1,14 @@
 """Main application logic."""
 
+import multiprocessing
 import os
 import pathlib
 import platform
 import sys
+import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict
 from typing import Any
 
 from dotenv import load_dotenv
@@ -12,12 +16,34 @@ from loguru import logger
 from nicegui import app, ui
 
 from .config.manager import load_config
+from .config.schema import AppConfig, ModuleConfig
 from .ui.dashboard import render_dashboard, render_module_detail
-from .ui.stats_dashboard import render_stats_dashboard
+from .utils.lazy_module import module_cache
+from .utils.storage import get_storage_manager
 from .utils.system_monitor import get_performance_tracker
 
 stats_collector = get_performance_tracker()
 
+_PACKAGE_DIR = pathlib.Path(__file__).parent.resolve()
+_STATIC_DIR = str(_PACKAGE_DIR / "static")
+_FAVICON = str(_PACKAGE_DIR / "assets" / "img" / "favicon.ico")
+
+_IS_WINDOWS = platform.system() == "Windows"
+
+# Fixed-version WebView2 runtime shipped alongside the app on Windows
+# Reference: https://learn.microsoft.com/zh-cn/microsoft-edge/webview2/concepts/distribution?tabs=dotnetcsharp#details-about-the-fixed-version-runtime-distribution-mode
+_WEBVIEW2_PATH = str(
+    _PACKAGE_DIR.parent.parent
+    / "runtime"
+    / "Microsoft.WebView2.FixedVersionRuntime.138.0.3351.121.x64"
+)
+
+_PREINIT_LOCK_PATH = (
+    pathlib.Path(tempfile.gettempdir()) / "modular_dashboard_preinit.lock"
+)
+# Held open for the lifetime of the process that won the pre-init lock
+_preinit_lock_file = None
+
 
 def initialize_app(config: dict[str, Any]) -> None:
     """Initialize the NiceGUI application.
@@ -33,7 +59,7 @@ def initialize_app(config: dict[str, Any]) -> None:
     # logger.info(f"App config: {config}")
 
     # Add static files
-    app.add_static_files("/static", "src/modular_dashboard/static")
+    app.add_static_files("/static", _STATIC_DIR)
 
     # Add custom CSS
     ui.add_head_html("""
@@ -47,6 +73,148 @@ def initialize_app(config: dict[str, Any]) -> None:
         ui.dark_mode().disable()
 
 
+def _init_module(module_class: type, module_config: ModuleConfig) -> float:
+    """Instantiate a module and return its initialization time in seconds.
+
+    The instance is handed to the shared module cache so the dashboard
+    reuses it instead of constructing the module a second time.
+    """
+    start_time = time.perf_counter()
+    instance = module_class(module_config.config)
+    init_time = time.perf_counter() - start_time
+
+    module_cache.preload(
+        str(module_config.id), module_class, module_config.config, instance
+    )
+    return init_time
+
+
+def _preinitialize_modules(config: AppConfig) -> None:
+    """Initialize enabled modules once to collect startup statistics.
+
+    Module constructors are mostly I/O-bound, so they run concurrently and
+    only per-module init time is recorded; tracemalloc is process-global, so
+    memory is reported as a single total for the whole batch. Set
+    ``DEEP_MEMORY_PROFILE=1`` to initialize serially and diff tracemalloc
+    snapshots around each module instead.
+
+    Parameters
+    ----------
+    config : AppConfig
+        The loaded application configuration.
+    """
+    import tracemalloc
+
+    from .modules.registry import MODULE_REGISTRY
+
+    # Get all module IDs that are enabled in column_config
+    enabled_module_ids = set()
+    for column_config in config.layout.column_config:
+        enabled_module_ids.update(column_config.modules)
+
+    # Only initialize modules that are both in column_config and have configuration in modules section;
+    # resolve each module class once so the loops below don't repeat the lookup
+    get_module_class = MODULE_REGISTRY.get
+    modules_to_init = [
+        (module_config, module_class)
+        for module_config in config.modules
+        if module_config.id in enabled_module_ids
+        and (module_class := get_module_class(module_config.id)) is not None
+    ]
+    if not modules_to_init:
+        return
+
+    record_init = stats_collector.record_init
+
+    # Create the shared storage manager up front so worker threads don't race
+    # to construct the singleton
+    get_storage_manager()
+
+    tracemalloc.start()
+
+    if os.getenv("DEEP_MEMORY_PROFILE") == "1":
+        take_snapshot = tracemalloc.take_snapshot
+        for module_config, module_class in modules_to_init:
+            try:
+                snapshot1 = take_snapshot()
+                init_time = _init_module(module_class, module_config)
+                snapshot2 = take_snapshot()
+                memory_usage = sum(
+                    stat.size_diff for stat in snapshot2.compare_to(snapshot1, "lineno")
+                )
+
+                record_init(str(module_config.id), init_time, max(0, memory_usage))
+                logger.info(
+                    f"Pre-initialized {module_config.id} in {init_time:.6f}s, memory: {memory_usage} bytes"
+                )
+            except Exception as e:
+                logger.warning(f"Failed to pre-initialize {module_config.id}: {e}")
+                # Still record failed attempts with 0 time
+                record_init(str(module_config.id), 0.0, 0)
+    else:
+        memory_before, _ = tracemalloc.get_traced_memory()
+
+        with ThreadPoolExecutor(max_workers=min(8, len(modules_to_init))) as executor:
+            futures = {
+                executor.submit(
+                    _init_module, module_class, module_config
+                ): module_config
+                for module_config, module_class in modules_to_init
+            }
+            for future in as_completed(futures):
+                module_config = futures[future]
+                try:
+                    init_time = future.result()
+                except Exception as e:
+                    logger.warning(f"Failed to pre-initialize {module_config.id}: {e}")
+                    # Still record failed attempts with 0 time
+                    record_init(str(module_config.id), 0.0, 0)
+                    continue
+
+                record_init(str(module_config.id), init_time)
+                logger.info(f"Pre-initialized {module_config.id} in {init_time:.6f}s")
+
+        memory_after, _ = tracemalloc.get_traced_memory()
+        logger.info(
+            f"Pre-initialized {len(modules_to_init)} modules, memory: {max(0, memory_after - memory_before)} bytes"
+        )
+
+    tracemalloc.stop()
+
+
+def _claim_preinit(reload_enabled: bool) -> bool:
+    """Return whether this process should pre-initialize modules.
+
+    With auto-reload the main process only supervises the worker that
+    actually serves pages, so it never pre-initializes. Otherwise an
+    exclusive, non-blocking file lock held until the process exits ensures
+    helper processes that re-import the app (e.g. the native window) skip
+    the work while the serving process is alive; a reloaded worker gets the
+    lock back once its predecessor exits.
+    """
+    global _preinit_lock_file
+
+    if reload_enabled and multiprocessing.current_process().name == "MainProcess":
+        return False
+
+    lock_file = open(_PREINIT_LOCK_PATH, "a+b")  # noqa: SIM115 - kept open to hold the lock
+    try:
+        if _IS_WINDOWS:
+            import msvcrt
+
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return False
+
+    _preinit_lock_file = lock_file
+    return True
+
+
 def run_app(native: bool = False) -> None:
     """Run the Modular Dashboard application.
 
@@ -69,6 +237,11 @@ def run_app(native: bool = False) -> None:
     Exception
         If the application fails to start due to configuration or runtime errors.
     """
+    # Setup already ran in this process (e.g. the module was re-imported);
+    # pages and static routes are registered, so don't redo the work
+    if getattr(app, "_md_initialized", False):
+        return
+
     try:
         # Load environment variables from .env file
         load_dotenv()
@@ -77,57 +250,16 @@ def run_app(native: bool = False) -> None:
         config = load_config()
 
         # Initialize the application
-        initialize_app(config.__dict__)
-
-        # Collect initial module statistics in development mode
-        if os.getenv("ENVIRONMENT", "production").lower() == "development":
-            import tracemalloc
-
-            from .modules.registry import MODULE_REGISTRY
-
-            tracemalloc.start()
+        initialize_app(asdict(config))
 
-            # Get all module IDs that are enabled in column_config
-            enabled_module_ids = set()
-            for column_config in config.layout.column_config:
-                enabled_module_ids.update(column_config.modules)
+        # Determine if we should enable auto-reload based on environment
+        # Default to production environment if not specified
+        environment = os.getenv("ENVIRONMENT", "production").lower()
+        reload_enabled = environment == "development"
 
-            # Force initialization of only enabled modules to collect stats
-            # Only initialize modules that are both in column_config and have configuration in modules section
-            for module_config in config.modules:
-                if module_config.id not in enabled_module_ids:
-                    continue
-                module_class = MODULE_REGISTRY.get(module_config.id)
-                if module_class:
-                    try:
-                        # Memory tracking
-                        snapshot1 = tracemalloc.take_snapshot()
-
-                        # High precision timing
-                        start_time = time.perf_counter()
-                        module_class(module_config.config)
-                        init_time = time.perf_counter() - start_time
-
-                        snapshot2 = tracemalloc.take_snapshot()
-                        memory_usage = sum(
-                            stat.size_diff
-                            for stat in snapshot2.compare_to(snapshot1, "lineno")
-                        )
-
-                        stats_collector.record_init(
-                            str(module_config.id), init_time, max(0, memory_usage)
-                        )
-                        logger.info(
-                            f"Pre-initialized {module_config.id} in {init_time:.6f}s, memory: {memory_usage} bytes"
-                        )
-                    except Exception as e:
-                        logger.warning(
-                            f"Failed to pre-initialize {module_config.id}: {e}"
-                        )
-                        # Still record failed attempts with 0 time
-                        stats_collector.record_init(str(module_config.id), 0.0, 0)
-
-            tracemalloc.stop()
+        # Collect initial module statistics in development mode
+        if environment == "development" and _claim_preinit(reload_enabled):
+            _preinitialize_modules(config)
 
         # Setup main dashboard page
         @ui.page("/")
@@ -143,34 +275,30 @@ def run_app(native: bool = False) -> None:
         @ui.page("/stats")
         def stats_page():
             """Create a unified page for performance and memory statistics."""
+            # Imported on first visit; most sessions never open this page
+            from .ui.stats_dashboard import render_stats_dashboard
+
             render_stats_dashboard()
 
-        # Determine if we should enable auto-reload based on environment
-        # Default to production environment if not specified
-        environment = os.getenv("ENVIRONMENT", "production").lower()
-        reload_enabled = environment == "development"
+        app._md_initialized = True
 
-        # On Windows, set the WebView2 runtime path
-        # Reference: https://learn.microsoft.com/zh-cn/microsoft-edge/webview2/concepts/distribution?tabs=dotnetcsharp#details-about-the-fixed-version-runtime-distribution-mode
-        if native and platform.system() == "Windows":
-            os.environ["WEBVIEW2_BROWSER_EXECUTABLE_FOLDER"] = str(
-                pathlib.Path(__file__).parent.parent.parent
-                / r"runtime\Microsoft.WebView2.FixedVersionRuntime.138.0.3351.121.x64"
-            )
+        # On Windows, set the WebView2 runtime path unless the user already did
+        if native and _IS_WINDOWS:
+            os.environ.setdefault("WEBVIEW2_BROWSER_EXECUTABLE_FOLDER", _WEBVIEW2_PATH)
 
         # Run the application
         if native:
             ui.run(
                 title="Dashboard",
                 native=True,
-                favicon="src/modular_dashboard/assets/img/favicon.ico",
+                favicon=_FAVICON,
                 window_size=(1024, 786),
                 reload=reload_enabled,  # Enable auto-reload based on environment
             )
         else:
             ui.run(
                 title="Dashboard",
-                favicon="src/modular_dashboard/assets/img/favicon.ico",
+                favicon=_FAVICON,
                 reload=reload_enabled,  # Enable auto-reload based on environment
             )
     except Exception as e:
@@ -178,4 +306,7 @@ def run_app(native: bool = False) -> None:
         raise
 
 
-run_app(native="--native" in sys.argv)
+# NiceGUI's reload worker re-imports this module as "__mp_main__" and needs
+# the pages registered; plain imports of the module must not start the app
+if __name__ in {"__main__", "__mp_main__"}:
+    run_app(native="--native" in sys.argv)
@@ -1,12 +1,17 @@
 """Configuration management."""
 
-import json
+import functools
 import os
+import threading
+from dataclasses import asdict
 from pathlib import Path
+from typing import Any
 
+from ..utils.json_utils import dumps_indented, loads
 from .schema import AppConfig, ColumnConfig, LayoutConfig, ModuleConfig
 
 
+@functools.cache
 def get_config_dir():
     """Get the system-specific configuration directory.
 
@@ -39,7 +44,44 @@ DEFAULT_CONFIG_FILE = Path(__file__).parent.parent / "assets" / "default-config.
 
 # Configuration cache
 _cached_config: AppConfig | None = None
-_config_last_modified: float | None = None
+# (st_mtime_ns, st_size) of CONFIG_FILE when _cached_config was loaded
+_config_cache_key: tuple[int, int] | None = None
+# Serializes cache misses so only one thread parses (or creates) the file
+_config_lock = threading.Lock()
+
+
+def _stat_key(path: Path) -> tuple[int, int] | None:
+    """Return a cheap change-detection key for a file, or None if it's missing."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _read_json(path: Path) -> Any:
+    """Parse a JSON file."""
+    return loads(path.read_bytes())
+
+
+def _write_bytes_atomic(path: Path, content: bytes) -> None:
+    """Write bytes to a file so readers never see it partially written.
+
+    The content goes to a temporary file next to ``path`` that then
+    replaces it.
+    """
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    try:
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Atomically write data to a JSON file indented by two spaces."""
+    _write_bytes_atomic(path, dumps_indented(data))
 
 
 def load_config() -> AppConfig:
@@ -61,57 +103,59 @@ def load_config() -> AppConfig:
     is loaded from the assets directory and saved to the user config directory
     on first run.
     """
-    global _cached_config, _config_last_modified
+    global _cached_config, _config_cache_key
 
-    # Check if config file exists and get its modification time
-    config_exists = CONFIG_FILE.exists()
-    current_mtime = CONFIG_FILE.stat().st_mtime if config_exists else None
+    # A single stat tells whether the file exists and whether it has changed
+    cache_key = _stat_key(CONFIG_FILE)
 
     # Return cached config if file hasn't changed
-    if _cached_config is not None and current_mtime == _config_last_modified:
+    if _cached_config is not None and cache_key == _config_cache_key:
         return _cached_config
 
-    # Create config directory if it doesn't exist
-    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    with _config_lock:
+        # Another thread may have loaded (or created) the file while we waited
+        cache_key = _stat_key(CONFIG_FILE)
+        if _cached_config is not None and cache_key == _config_cache_key:
+            return _cached_config
 
-    # Load config file if exists, otherwise create from default
-    if config_exists:
-        with CONFIG_FILE.open("r") as f:
-            config_data = json.load(f)
-    else:
-        # Load default config
-        with DEFAULT_CONFIG_FILE.open("r") as f:
-            config_data = json.load(f)
-        # Save default config to user config file
-        with CONFIG_FILE.open("w") as f:
-            json.dump(config_data, f, indent=2)
+        # Create config directory if it doesn't exist
+        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+
+        # Load config file if exists, otherwise create from default
+        if cache_key is not None:
+            config_data = _read_json(CONFIG_FILE)
+        else:
+            # Copy the default config to the user config file as-is instead of
+            # re-serializing it, and parse it from the same bytes
+            default_config = DEFAULT_CONFIG_FILE.read_bytes()
+            _write_bytes_atomic(CONFIG_FILE, default_config)
+            config_data = loads(default_config)
+            cache_key = _stat_key(CONFIG_FILE)
 
-    # Convert to AppConfig object
-    layout_data = config_data.get("layout", {})
+        # Convert to AppConfig object
+        layout_data = config_data.get("layout", {})
 
-    # Properly convert column_config to ColumnConfig objects
-    column_config_data = layout_data.get("column_config", [])
-    column_configs = [ColumnConfig(**column) for column in column_config_data]
+        # Properly convert column_config to ColumnConfig objects
+        column_config_data = layout_data.get("column_config", [])
+        column_configs = [ColumnConfig(**column) for column in column_config_data]
 
-    # Update layout_data with converted column_configs
-    layout_data["column_config"] = column_configs
-    layout = LayoutConfig(**layout_data)
-    modules = [ModuleConfig(**module) for module in config_data.get("modules", [])]
+        # Update layout_data with converted column_configs
+        layout_data["column_config"] = column_configs
+        layout = LayoutConfig(**layout_data)
+        modules = [ModuleConfig(**module) for module in config_data.get("modules", [])]
 
-    config = AppConfig(
-        version=config_data.get("version", "0.1.0"),
-        theme=config_data.get("theme", "light"),
-        layout=layout,
-        modules=modules,
-    )
+        config = AppConfig(
+            version=config_data.get("version", "0.1.0"),
+            theme=config_data.get("theme", "light"),
+            layout=layout,
+            modules=modules,
+        )
 
-    # Cache the config
-    _cached_config = config
-    _config_last_modified = (
-        CONFIG_FILE.stat().st_mtime if CONFIG_FILE.exists() else None
-    )
+        # Cache the config
+        _cached_config = config
+        _config_cache_key = cache_key
 
-    return config
+        return config
 
 
 def invalidate_config_cache() -> None:
@@ -119,9 +163,10 @@ def invalidate_config_cache() -> None:
 
     This should be called when the configuration file is modified externally.
     """
-    global _cached_config, _config_last_modified
-    _cached_config = None
-    _config_last_modified = None
+    global _cached_config, _config_cache_key
+    with _config_lock:
+        _cached_config = None
+        _config_cache_key = None
 
 
 def save_config(config: AppConfig) -> None:
@@ -137,18 +182,13 @@ def save_config(config: AppConfig) -> None:
     The configuration is saved in JSON format with indentation for readability.
     Existing configuration files will be overwritten.
     """
-    # Convert ColumnConfig objects back to dictionaries
-    layout_dict = config.layout.__dict__.copy()
-    layout_dict["column_config"] = [
-        column.__dict__ for column in config.layout.column_config
-    ]
-
+    # Convert the layout (including its ColumnConfig objects) and modules
+    # back to dictionaries
     config_data = {
         "version": config.version,
         "theme": config.theme,
-        "layout": layout_dict,
-        "modules": [module.__dict__ for module in config.modules],
+        "layout": asdict(config.layout),
+        "modules": [asdict(module) for module in config.modules],
     }
 
-    with CONFIG_FILE.open("w") as f:
-        json.dump(config_data, f, indent=2)
+    _write_json(CONFIG_FILE, config_data)
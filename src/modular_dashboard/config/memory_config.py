@@ -2,10 +2,12 @@
 
 from dataclasses import dataclass
 
+_MB_INV = 1.0 / (1024 * 1024)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class MemoryConfig:
-    """Configuration for memory management and caching."""
+    """Immutable configuration for memory management and caching."""
 
     max_cache_size: int = 1000  # Maximum number of cache entries
     max_memory_mb: int = 100  # Maximum memory usage in MB
@@ -19,7 +21,7 @@ class MemoryConfig:
     debug_memory_usage: bool = False  # Enable memory usage debugging
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheStats:
     """Cache usage statistics."""
 
@@ -38,4 +40,4 @@ class CacheStats:
     @property
     def memory_usage_mb(self) -> float:
         """Get memory usage in MB."""
-        return self.memory_usage_bytes / (1024 * 1024)
+        return self.memory_usage_bytes * _MB_INV
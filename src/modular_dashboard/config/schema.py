@@ -1,33 +1,26 @@
 """Configuration schema definitions."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from .memory_config import MemoryConfig
 
 
-@dataclass
+@dataclass(slots=True)
 class ModuleConfig:
     id: str
     position: int = 0
     collapsed: bool = False
-    config: dict = None
-
-    def __post_init__(self):
-        if self.config is None:
-            self.config = {}
+    config: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ColumnConfig:
     width: str = "normal"  # "narrow" or "normal"
-    modules: list[str] = None  # List of module IDs to display in this column
-
-    def __post_init__(self):
-        if self.modules is None:
-            self.modules = []
+    # List of module IDs to display in this column
+    modules: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class LayoutConfig:
     columns: int = 1  # Number of columns (1-3)
     width: str = "default"  # "slim", "default", "wide"
@@ -41,14 +34,10 @@ class LayoutConfig:
             self.column_config = [ColumnConfig() for _ in range(self.columns)]
 
 
-@dataclass
+@dataclass(slots=True)
 class AppConfig:
     version: str
     theme: str
     layout: LayoutConfig
     modules: list[ModuleConfig]
-    memory: MemoryConfig = None
-
-    def __post_init__(self):
-        if self.memory is None:
-            self.memory = MemoryConfig()
+    memory: MemoryConfig = field(default_factory=MemoryConfig)
@@ -1,192 +1,249 @@
 """Documentation generation system for Modular Dashboard."""
 
-import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 from ..config.manager import load_config
-from ..modules.registry import MODULE_REGISTRY
+from ..utils.json_utils import dumps_indented
+
+_DOCS_DIRS = tuple(
+    Path(path) for path in ("docs", "docs/modules", "docs/api", "docs/development")
+)
+
+# Static page content; only the module pages interpolate per-module data
+_INDEX_MD = """\
+# Modular Dashboard Documentation
+
+Welcome to the Modular Dashboard documentation.
+
+## Table of Contents
+
+- [Modules](./modules/index.md)
+- [API Reference](./api/index.md)
+- [Development Guide](./development/index.md)
+- [README](./README.md)
+
+"""
+
+_DATA_FORMAT_MD = """\
+## Data Format
+
+This module provides data in the following standardized format:
+
+```json
+{
+  "title": "string",
+  "summary": "string",
+  "link": "string (URL)",
+  "published": "string (ISO8601)",
+  "tags": "List[string]",
+  "extra": "Dict (optional additional fields)"
+}
+```
+
+## Example Data
+
+Here's an example of the data provided by this module:
+
+```json
+"""
+
+_API_DOCS_MD = """\
+# API Documentation
+
+This section documents the internal APIs of the Modular Dashboard.
+
+## Configuration API
+
+The configuration system is managed through the following components:
+
+- `config.manager` - Functions for loading and saving configuration
+- `config.schema` - Data classes defining the configuration structure
+
+## Module API
+
+Modules implement a standardized interface defined in `modules.base.Module`:
+
+```python
+class Module(ABC):
+    @property
+    @abstractmethod
+    def id(self) -> str: ...
+
+    @property
+    @abstractmethod
+    def name(self) -> str: ...
+
+    @property
+    @abstractmethod
+    def icon(self) -> str: ...
+
+    @property
+    @abstractmethod
+    def description(self) -> str: ...
+
+    @abstractmethod
+    def fetch(self) -> List[Dict[str, Any]]: ...
+
+    @abstractmethod
+    def render(self) -> None: ...
+
+    def render_detail(self) -> None: ...
+```
+"""
+
+_DEV_DOCS_MD = """\
+# Development Guide
+
+This guide provides information for developers working on the Modular Dashboard.
+
+## Project Structure
+
+```
+modular-dashboard/
+│
+├── pyproject.toml             # Project configuration
+├── README.md                  # Project overview
+├── LICENSE                    # License information
+├── .gitignore                 # Git ignore patterns
+│
+├── src/
+│   └── modular_dashboard/    # Main source code
+│       ├── __init__.py
+│       ├── __main__.py        # Entry point
+│       ├── app.py             # Main application logic
+│       │
+│       ├── config/            # Configuration system
+│       ├── modules/           # Module system
+│       ├── ui/                # User interface components
+│       ├── static/            # Static assets
+│       ├── utils/             # Utility functions
+│       └── assets/            # Application assets
+│
+├── config/                    # User configuration
+├── scripts/                   # Utility scripts
+├── tests/                     # Test suite
+└── docs/                      # Documentation
+```
+
+## Getting Started
+
+1. Install dependencies:
+   ```bash
+   uv pip install -e .
+   ```
+
+2. Run the application:
+   ```bash
+   uv run -m modular_dashboard
+   ```
+
+3. Run as native desktop app:
+   ```bash
+   uv run -m modular_dashboard --native
+   ```
+"""
 
 
 def generate_module_docs() -> None:
     """Generate documentation for all modules."""
+    # Importing the registry imports every module (and nicegui, httpx, ...),
+    # so only pay for it when module docs are actually generated
+    from ..modules.registry import MODULE_REGISTRY
+
     docs_dir = Path("docs/modules")
-    docs_dir.mkdir(exist_ok=True)
 
     # Load configuration
     config = load_config()
 
+    # Modules placed in the layout are the enabled ones; instantiate each once
+    enabled_module_ids = {
+        module_id
+        for column_config in config.layout.column_config
+        for module_id in column_config.modules
+    }
+    modules = [
+        MODULE_REGISTRY[module_config.id]()
+        for module_config in config.modules
+        if module_config.id in enabled_module_ids
+        and module_config.id in MODULE_REGISTRY
+    ]
+
+    # Fetching example data is network-bound, so fetch for all modules at once
+    examples: list[dict[str, Any] | None] = []
+    if modules:
+        with ThreadPoolExecutor(max_workers=min(8, len(modules))) as executor:
+            examples = list(executor.map(_safe_fetch, modules))
+
     # Generate index page
-    with open(docs_dir / "index.md", "w") as f:
-        f.write("# Modules Documentation\n\n")
-        f.write(
-            "This section contains documentation for all modules in the Modular Dashboard.\n\n"
-        )
-        f.write("## Available Modules\n\n")
-
-        for module_config in config.modules:
-            if module_config.enabled and module_config.id in MODULE_REGISTRY:
-                module_class = MODULE_REGISTRY[module_config.id]
-                module = module_class()
-
-                f.write(f"- [{module.name}](./{module.id}.md) - {module.description}\n")
-
-                # Generate individual module documentation
-                generate_module_detail_docs(module, docs_dir)
-
-
-def generate_module_detail_docs(module: Any, docs_dir: Path) -> None:
-    """Generate detailed documentation for a specific module."""
-    with open(docs_dir / f"{module.id}.md", "w") as f:
-        f.write(f"# {module.name}\n\n")
-        f.write(f"**ID**: `{module.id}`\n\n")
-        f.write(f"**Icon**: {module.icon}\n\n")
-        f.write(f"**Description**: {module.description}\n\n")
-
-        # Add section for data format
-        f.write("## Data Format\n\n")
-        f.write("This module provides data in the following standardized format:\n\n")
-        f.write("```json\n")
-        f.write("{\n")
-        f.write('  "title": "string",\n')
-        f.write('  "summary": "string",\n')
-        f.write('  "link": "string (URL)",\n')
-        f.write('  "published": "string (ISO8601)",\n')
-        f.write('  "tags": "List[string]",\n')
-        f.write('  "extra": "Dict (optional additional fields)"\n')
-        f.write("}\n")
-        f.write("```\n\n")
-
-        # Add example data
-        f.write("## Example Data\n\n")
-        f.write("Here's an example of the data provided by this module:\n\n")
-        f.write("```json\n")
-        example_data = module.fetch()
-        if example_data:
-            f.write(json.dumps(example_data[0], indent=2))
-        f.write("\n```\n")
+    parts: list[str] = []
+    parts.append("# Modules Documentation\n\n")
+    parts.append(
+        "This section contains documentation for all modules in the Modular Dashboard.\n\n"
+    )
+    parts.append("## Available Modules\n\n")
+
+    for module, example in zip(modules, examples, strict=True):
+        parts.append(f"- [{module.name}](./{module.id}.md) - {module.description}\n")
+
+        # Generate individual module documentation
+        generate_module_detail_docs(module, docs_dir, example)
+
+    (docs_dir / "index.md").write_text("".join(parts))
+
+
+def _safe_fetch(module: Any) -> dict[str, Any] | None:
+    """Return the first item a module fetches, or None if fetching fails."""
+    try:
+        data = module.fetch()
+    except Exception:
+        return None
+    return data[0] if data else None
+
+
+def generate_module_detail_docs(
+    module: Any, docs_dir: Path, example: dict[str, Any] | None = None
+) -> None:
+    """Generate detailed documentation for a specific module.
+
+    ``example`` is an item previously fetched from the module; it is shown
+    as the module's example data when given.
+    """
+    parts: list[str] = []
+    parts.append(f"# {module.name}\n\n")
+    parts.append(f"**ID**: `{module.id}`\n\n")
+    parts.append(f"**Icon**: {module.icon}\n\n")
+    parts.append(f"**Description**: {module.description}\n\n")
+
+    parts.append(_DATA_FORMAT_MD)
+    if example:
+        parts.append(dumps_indented(example).decode())
+    parts.append("\n```\n")
+
+    (docs_dir / f"{module.id}.md").write_text("".join(parts))
 
 
 def generate_api_docs() -> None:
     """Generate API documentation."""
-    docs_dir = Path("docs/api")
-    docs_dir.mkdir(exist_ok=True)
-
-    with open(docs_dir / "index.md", "w") as f:
-        f.write("# API Documentation\n\n")
-        f.write(
-            "This section documents the internal APIs of the Modular Dashboard.\n\n"
-        )
-
-        # Configuration API
-        f.write("## Configuration API\n\n")
-        f.write(
-            "The configuration system is managed through the following components:\n\n"
-        )
-        f.write("- `config.manager` - Functions for loading and saving configuration\n")
-        f.write(
-            "- `config.schema` - Data classes defining the configuration structure\n\n"
-        )
-
-        # Module API
-        f.write("## Module API\n\n")
-        f.write(
-            "Modules implement a standardized interface defined in `modules.base.Module`:\n\n"
-        )
-        f.write("```python\n")
-        f.write("class Module(ABC):\n")
-        f.write("    @property\n")
-        f.write("    @abstractmethod\n")
-        f.write("    def id(self) -> str: ...\n\n")
-        f.write("    @property\n")
-        f.write("    @abstractmethod\n")
-        f.write("    def name(self) -> str: ...\n\n")
-        f.write("    @property\n")
-        f.write("    @abstractmethod\n")
-        f.write("    def icon(self) -> str: ...\n\n")
-        f.write("    @property\n")
-        f.write("    @abstractmethod\n")
-        f.write("    def description(self) -> str: ...\n\n")
-        f.write("    @abstractmethod\n")
-        f.write("    def fetch(self) -> List[Dict[str, Any]]: ...\n\n")
-        f.write("    @abstractmethod\n")
-        f.write("    def render(self) -> None: ...\n\n")
-        f.write("    def render_detail(self) -> None: ...\n")
-        f.write("```\n")
+    Path("docs/api/index.md").write_text(_API_DOCS_MD)
 
 
 def generate_development_docs() -> None:
     """Generate development documentation."""
-    docs_dir = Path("docs/development")
-    docs_dir.mkdir(exist_ok=True)
-
-    with open(docs_dir / "index.md", "w") as f:
-        f.write("# Development Guide\n\n")
-        f.write(
-            "This guide provides information for developers working on the Modular Dashboard.\n\n"
-        )
-
-        # Project structure
-        f.write("## Project Structure\n\n")
-        f.write("```\n")
-        f.write("modular-dashboard/\n")
-        f.write("│\n")
-        f.write("├── pyproject.toml             # Project configuration\n")
-        f.write("├── README.md                  # Project overview\n")
-        f.write("├── LICENSE                    # License information\n")
-        f.write("├── .gitignore                 # Git ignore patterns\n")
-        f.write("│\n")
-        f.write("├── src/\n")
-        f.write("│   └── modular_dashboard/    # Main source code\n")
-        f.write("│       ├── __init__.py\n")
-        f.write("│       ├── __main__.py        # Entry point\n")
-        f.write("│       ├── app.py             # Main application logic\n")
-        f.write("│       │\n")
-        f.write("│       ├── config/            # Configuration system\n")
-        f.write("│       ├── modules/           # Module system\n")
-        f.write("│       ├── ui/                # User interface components\n")
-        f.write("│       ├── static/            # Static assets\n")
-        f.write("│       ├── utils/             # Utility functions\n")
-        f.write("│       └── assets/            # Application assets\n")
-        f.write("│\n")
-        f.write("├── config/                    # User configuration\n")
-        f.write("├── scripts/                   # Utility scripts\n")
-        f.write("├── tests/                     # Test suite\n")
-        f.write("└── docs/                      # Documentation\n")
-        f.write("```\n\n")
-
-        # Getting started
-        f.write("## Getting Started\n\n")
-        f.write("1. Install dependencies:\n")
-        f.write("   ```bash\n")
-        f.write("   uv pip install -e .\n")
-        f.write("   ```\n\n")
-        f.write("2. Run the application:\n")
-        f.write("   ```bash\n")
-        f.write("   uv run -m modular_dashboard\n")
-        f.write("   ```\n\n")
-        f.write("3. Run as native desktop app:\n")
-        f.write("   ```bash\n")
-        f.write("   uv run -m modular_dashboard --native\n")
-        f.write("   ```\n")
+    Path("docs/development/index.md").write_text(_DEV_DOCS_MD)
 
 
 def generate_documentation() -> None:
     """Generate all documentation."""
     print("Generating documentation...")
 
-    # Create main docs directory if it doesn't exist
-    Path("docs").mkdir(exist_ok=True)
+    # Create the docs directory tree up front for all generators below
+    for docs_dir in _DOCS_DIRS:
+        docs_dir.mkdir(parents=True, exist_ok=True)
 
     # Generate main documentation index
-    with open("docs/index.md", "w") as f:
-        f.write("# Modular Dashboard Documentation\n\n")
-        f.write("Welcome to the Modular Dashboard documentation.\n\n")
-        f.write("## Table of Contents\n\n")
-        f.write("- [Modules](./modules/index.md)\n")
-        f.write("- [API Reference](./api/index.md)\n")
-        f.write("- [Development Guide](./development/index.md)\n")
-        f.write("- [README](./README.md)\n\n")
+    Path("docs/index.md").write_text(_INDEX_MD)
 
     # Generate module documentation
     generate_module_docs()
@@ -198,8 +255,7 @@ def generate_documentation() -> None:
     generate_development_docs()
 
     # Copy README to docs
-    with open("README.md") as src, open("docs/README.md", "w") as dst:
-        dst.write(src.read())
+    Path("docs/README.md").write_text(Path("README.md").read_text())
 
     print("Documentation generated successfully!")
 
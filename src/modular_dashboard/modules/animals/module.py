@@ -1,16 +1,101 @@
 """Animals module implementation."""
 
+import asyncio
 import random
-from typing import Any
+import time
+from collections.abc import Callable
+from typing import Any, NamedTuple
 from urllib.parse import urljoin
 
 import httpx
 from nicegui import ui
 
 from ...ui.styles import DashboardStyles
+from ...utils.json_utils import parse_response
 from ..extended import ExtendedModule
 
 
+class AnimalEndpoint(NamedTuple):
+    """API endpoint and response handling for one animal type."""
+
+    url: str
+    # Pulls the image URL out of the API's JSON response
+    extractor: Callable[[dict], str]
+    title: str
+
+
+_ANIMALS: dict[str, AnimalEndpoint] = {
+    # {url: "/cat/..."}, relative to cataas.com
+    "cat": AnimalEndpoint(
+        "https://cataas.com/cat?json=true",
+        lambda data: urljoin("https://cataas.com", data["url"]),
+        "Random Cat",
+    ),
+    # {message: "https://images.dog.ceo/..."}
+    "dog": AnimalEndpoint(
+        "https://dog.ceo/api/breeds/image/random",
+        lambda data: data["message"],
+        "Random Dog",
+    ),
+    # {url: "https://random-d.uk/api/v2/..."}
+    "duck": AnimalEndpoint(
+        "https://random-d.uk/api/v2/random",
+        lambda data: data["url"],
+        "Random Duck",
+    ),
+    # {image: "https://randomfox.ca/..."}
+    "fox": AnimalEndpoint(
+        "https://randomfox.ca/floof/",
+        lambda data: data["image"],
+        "Random Fox",
+    ),
+    # maxz.dev APIs return {url: "https://cdn.maxz.dev/..."}
+    "rabbit": AnimalEndpoint(
+        "https://animals.maxz.dev/api/rabbit/random",
+        lambda data: data["url"],
+        "Random Rabbit",
+    ),
+    "capybara": AnimalEndpoint(
+        "https://animals.maxz.dev/api/capybara/random",
+        lambda data: data["url"],
+        "Random Capybara",
+    ),
+    "hamster": AnimalEndpoint(
+        "https://animals.maxz.dev/api/hamster/random",
+        lambda data: data["url"],
+        "Random Hamster",
+    ),
+}
+_ANIMAL_KEYS = tuple(_ANIMALS)
+
+
+def _make_fetcher(
+    animal_type: str, endpoint: AnimalEndpoint
+) -> Callable[[], dict[str, Any]]:
+    """Build a fetcher with everything about one animal type bound in."""
+    url, extractor, title = endpoint
+
+    def fetch_image() -> dict[str, Any]:
+        response = ExtendedModule.get_http_client(url).get(url)
+        response.raise_for_status()
+        return {
+            "title": title,
+            "image_url": extractor(parse_response(response)),
+            "animal_type": animal_type,
+            "api_url": url,
+        }
+
+    return fetch_image
+
+
+# Synchronous fetchers specialized per animal type, built once at import
+_FETCHERS = {
+    animal_type: _make_fetcher(animal_type, endpoint)
+    for animal_type, endpoint in _ANIMALS.items()
+}
+_FETCHER_CHOICES = tuple(_FETCHERS.values())
+
+
 class AnimalsModule(ExtendedModule):
     @property
     def id(self) -> str:
@@ -102,106 +187,80 @@ class AnimalsModule(ExtendedModule):
 
     def __init__(self, config: dict[str, Any] | None = None):
         super().__init__(config)
-        self.config = {**self.get_default_config(), **(config or {})}
+        # get_default_config() returns a fresh dict, so it can be updated in place
+        self.config = self.get_default_config()
+        if config:
+            self.config.update(config)
         self.current_image_url = None
         self.current_animal_type = None
         self._timer = None
 
-    def get_animal_apis(self) -> dict[str, str]:
-        """Get API endpoints for different animal types."""
-        return {
-            "cat": "https://cataas.com/cat?json=true",
-            "dog": "https://dog.ceo/api/breeds/image/random",
-            "duck": "https://random-d.uk/api/v2/random",
-            "fox": "https://randomfox.ca/floof/",
-            "rabbit": "https://animals.maxz.dev/api/rabbit/random",
-            "capybara": "https://animals.maxz.dev/api/capybara/random",
-            "hamster": "https://animals.maxz.dev/api/hamster/random",
-        }
+        # Created on first use and reused so connections (and TLS sessions)
+        # are kept alive between refreshes; sync requests use the pooled
+        # client from Module.get_http_client
+        self._async_client: httpx.AsyncClient | None = None
+        # Last fetch result per configured animal type: (monotonic time, items)
+        self._image_cache: dict[str, tuple[float, list[dict[str, Any]]]] = {}
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Return the shared asynchronous HTTP client."""
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(timeout=10.0)
+        return self._async_client
 
     async def fetch_animal_image(self, animal_type: str) -> dict[str, Any]:
         """Fetch a random animal image from the specified API."""
-        apis = self.get_animal_apis()
-
         if animal_type == "random":
-            animal_type = random.choice(list(apis.keys()))
+            animal_type = random.choice(_ANIMAL_KEYS)
 
-        api_url = apis.get(animal_type)
-        if not api_url:
+        endpoint = _ANIMALS.get(animal_type)
+        if endpoint is None:
             raise ValueError(f"Unsupported animal type: {animal_type}")
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(api_url)
-                response.raise_for_status()
-                data = response.json()
-
-                # Extract image URL from response
-                image_url = self._extract_image_url(data, animal_type, api_url)
-
-                return {
-                    "title": f"Random {animal_type.title()}",
-                    "image_url": image_url,
-                    "animal_type": animal_type,
-                    "api_url": api_url,
-                }
+            response = await self._get_async_client().get(endpoint.url)
+            response.raise_for_status()
+
+            # Extract image URL from response
+            image_url = endpoint.extractor(parse_response(response))
+
+            return {
+                "title": endpoint.title,
+                "image_url": image_url,
+                "animal_type": animal_type,
+                "api_url": endpoint.url,
+            }
         except Exception as e:
             raise Exception(f"Failed to fetch {animal_type} image: {str(e)}") from e
 
-    def _extract_image_url(self, data: dict, animal_type: str, api_url: str) -> str:
-        """Extract image URL from API response."""
-        if animal_type == "cat":
-            # Cat API returns {url: "https://cataas.com/cat/..."}
-            base_url = "https://cataas.com"
-            return urljoin(base_url, data["url"])
-        elif animal_type == "dog":
-            # Dog API returns {message: "https://images.dog.ceo/..."}
-            return data["message"]
-        elif animal_type == "duck":
-            # Duck API returns {url: "https://random-d.uk/api/v2/..."}
-            return data["url"]
-        elif animal_type == "fox":
-            # Fox API returns {image: "https://randomfox.ca/..."}
-            return data["image"]
-        elif animal_type in ["rabbit", "capybara", "hamster"]:
-            # Maxz.dev APIs return {url: "https://cdn.maxz.dev/..."}
-            return data["url"]
-        else:
-            raise ValueError(f"Unknown animal type: {animal_type}")
-
     def fetch(self) -> list[dict[str, Any]]:
         """Fetch animal image data."""
         try:
             animal_type = self.config.get("animal_type", "cat")
 
-            # For synchronous fetch, use httpx sync client
-            apis = self.get_animal_apis()
+            # Re-renders within the refresh interval reuse the last image
+            cache_key = animal_type
+            now = time.monotonic()
+            cached = self._image_cache.get(cache_key)
+            if cached and now - cached[0] < self.config.get("refresh_interval", 30):
+                return cached[1]
 
             if animal_type == "random":
-                animal_type = random.choice(list(apis.keys()))
-
-            api_url = apis.get(animal_type)
-            if not api_url:
-                return []
-
-            with httpx.Client(timeout=10.0) as client:
-                response = client.get(api_url)
-                response.raise_for_status()
-                data = response.json()
-
-                image_url = self._extract_image_url(data, animal_type, api_url)
-
-                self.current_image_url = image_url
-                self.current_animal_type = animal_type
-
-                return [
-                    {
-                        "title": f"Random {animal_type.title()}",
-                        "image_url": image_url,
-                        "animal_type": animal_type,
-                        "api_url": api_url,
-                    }
-                ]
+                fetch_image = random.choice(_FETCHER_CHOICES)
+            else:
+                fetch_image = _FETCHERS.get(animal_type)
+                if fetch_image is None:
+                    return []
+
+            # For synchronous fetch, use the pooled httpx client for the API host
+            item = fetch_image()
+
+            self.current_image_url = item["image_url"]
+            self.current_animal_type = item["animal_type"]
+
+            result = [item]
+            self._image_cache[cache_key] = (now, result)
+            return result
         except Exception as e:
             self._handle_error(e)
             return []
@@ -291,6 +350,7 @@ class AnimalsModule(ExtendedModule):
     def _refresh_image(self) -> None:
         """Refresh the current image."""
         try:
+            self._image_cache.pop(self.config.get("animal_type", "cat"), None)
             self.fetch()
             ui.notify("Image refreshed!", type="positive")
         except Exception as e:
@@ -313,8 +373,13 @@ class AnimalsModule(ExtendedModule):
 
     def _shutdown_module(self) -> None:
         """Clean up module-specific resources."""
-        # Clean up any timers or resources
-        pass
+        if self._async_client is not None:
+            client, self._async_client = self._async_client, None
+            try:
+                asyncio.get_running_loop().create_task(client.aclose())
+            except RuntimeError:
+                # No event loop running in this thread
+                asyncio.run(client.aclose())
 
     def has_cache(self) -> bool:
         """Check if module uses caching."""
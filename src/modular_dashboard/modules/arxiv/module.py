@@ -1,37 +1,40 @@
 """ArXiv module implementation."""
 
+import asyncio
 from typing import Any
 
 from nicegui import ui
 
 from ...ui.styles import DashboardStyles
+from ...utils.storage import CachedStorage
 from ..extended import ExtendedModule
 
+_SUMMARY_PREVIEW_CLS = DashboardStyles.TEXT_MUTED + " mt-1"
+_DETAIL_TITLE_CLS = DashboardStyles.TITLE_H1 + " mb-4"
+_PAPER_TITLE_CLS = DashboardStyles.TITLE_H2 + " hover-underline"
+_AUTHORS_CLS = DashboardStyles.TEXT_MUTED + " italic"
+_PUBLISHED_CLS = DashboardStyles.SUBTLE_TEXT + " mt-1"
+_SUMMARY_CLS = DashboardStyles.BODY_TEXT + " mt-2"
 
-class ArxivModule(ExtendedModule):
-    @property
-    def id(self) -> str:
-        return "arxiv"
-
-    @property
-    def name(self) -> str:
-        return "Arxiv Papers"
+# Number of paper cards rendered per "Show more" step in the detail view
+_DETAIL_PAGE_SIZE = 20
 
-    @property
-    def icon(self) -> str:
-        return "📚"
 
-    @property
-    def description(self) -> str:
-        return "Latest academic papers and publications based on your interests"
+def _add_display_fields(paper: dict[str, Any]) -> dict[str, Any]:
+    """Store the summary preview and publication date shown by the views."""
+    extra = paper["extra"]
+    extra["summary_preview"] = paper["summary"][:100] + "..."
+    extra["published_date"] = paper["published"][:10]
+    return paper
 
-    @property
-    def version(self) -> str:
-        return "1.0.0"
 
-    def fetch(self) -> list[dict[str, Any]]:
-        # Placeholder implementation
-        return [
+# Placeholder rows (here and in the other placeholder modules) are built and
+# given their display fields once at import; fetches return copies of each row
+# and its "extra" dict, while nested lists stay shared and are read-only.
+_PLACEHOLDER_PAPERS: tuple[dict[str, Any], ...] = tuple(
+    map(
+        _add_display_fields,
+        (
             {
                 "title": "Quantum Computing Advances",
                 "summary": "Recent breakthroughs in quantum computing algorithms and hardware implementations.",
@@ -56,7 +59,55 @@ class ArxivModule(ExtendedModule):
                 "tags": ["energy", "storage"],
                 "extra": {"authors": ["Eve Brown", "Frank Miller"]},
             },
-        ]
+        ),
+    )
+)
+
+
+class ArxivModule(ExtendedModule):
+    __slots__ = ()
+
+    id = "arxiv"
+    name = "Arxiv Papers"
+    icon = "📚"
+    description = "Latest academic papers and publications based on your interests"
+    version = "1.0.0"
+
+    def has_cache(self) -> bool:
+        """Check if module uses caching."""
+        return True
+
+    def fetch(self) -> list[dict[str, Any]]:
+        """Fetch the latest papers, reusing results cached within the TTL."""
+        # Try to get from cache first
+        cache = self.get_cache(self.config.get("cache_ttl", 900))
+        cached_data = cache.get("papers")
+
+        if cached_data is not None:
+            return cached_data
+
+        return self._fetch_and_cache(cache)
+
+    async def async_fetch(self) -> list[dict[str, Any]]:
+        """Fetch the latest papers, sharing one fetch between concurrent misses."""
+        cache = self.get_cache(self.config.get("cache_ttl", 900))
+        cached_data = cache.get("papers")
+
+        if cached_data is not None:
+            return cached_data
+
+        return await self.coalesce_async(
+            "papers", lambda: asyncio.to_thread(self._fetch_and_cache, cache)
+        )
+
+    def _fetch_and_cache(self, cache: CachedStorage) -> list[dict[str, Any]]:
+        papers = self._fetch_uncached()
+        cache.set("papers", papers)
+        return papers
+
+    def _fetch_uncached(self) -> list[dict[str, Any]]:
+        # Placeholder implementation
+        return [{**paper, "extra": {**paper["extra"]}} for paper in _PLACEHOLDER_PAPERS]
 
     def render(self) -> None:
         papers = self.fetch()
@@ -71,13 +122,13 @@ class ArxivModule(ExtendedModule):
                     )
 
                 # Summary
-                ui.label(paper["summary"][:100] + "...").classes(
-                    DashboardStyles.TEXT_MUTED + " mt-1"
+                ui.label(paper["extra"]["summary_preview"]).classes(
+                    _SUMMARY_PREVIEW_CLS
                 )
 
                 # Footer with date and tags
                 with ui.row().classes("items-center mt-2"):
-                    ui.label(paper["published"][:10]).classes(
+                    ui.label(paper["extra"]["published_date"]).classes(
                         DashboardStyles.SUBTLE_TEXT
                     )
                     for tag in paper["tags"][:2]:  # Show only first 2 tags
@@ -85,42 +136,54 @@ class ArxivModule(ExtendedModule):
 
     def render_detail(self) -> None:
         papers = self.fetch()
-        ui.label(f"Latest {len(papers)} Papers").classes(
-            DashboardStyles.TITLE_H1 + " mb-4"
-        )
-
-        for paper in papers:
-            with ui.card().classes("w-full mb-4 card-hover"):
-                # Title with link
-                with ui.link(target=paper["link"]).classes("no-underline text-inherit"):
-                    ui.label(paper["title"]).classes(
-                        DashboardStyles.TITLE_H2 + " hover-underline"
-                    )
-
-                # Authors
-                if "authors" in paper["extra"]:
-                    ui.label(", ".join(paper["extra"]["authors"])).classes(
-                        DashboardStyles.TEXT_MUTED + " italic"
-                    )
-
-                # Publication date
-                ui.label(f"Published: {paper['published'][:10]}").classes(
-                    DashboardStyles.SUBTLE_TEXT + " mt-1"
-                )
-
-                # Summary
-                ui.label(paper["summary"]).classes(DashboardStyles.BODY_TEXT + " mt-2")
-
-                # Tags
-                with ui.row().classes("mt-2"):
-                    for tag in paper["tags"]:
-                        ui.chip(tag).classes("mr-1")
-
-                # Action button
-                with ui.row().classes("w-full justify-end mt-2"):
-                    ui.button(
-                        "View on ArXiv",
-                        on_click=lambda link=paper["link"]: ui.run_javascript(
-                            f'window.open("{link}", "_blank")'
-                        ),
-                    ).props("outline")
+        ui.label(f"Latest {len(papers)} Papers").classes(_DETAIL_TITLE_CLS)
+
+        # Cards are built one page at a time so long result lists don't
+        # create every card (and its nested elements) up front
+        container = ui.column().classes("w-full gap-0")
+        shown = 0
+
+        def show_more() -> None:
+            nonlocal shown
+            with container:
+                for paper in papers[shown : shown + _DETAIL_PAGE_SIZE]:
+                    self._render_paper_card(paper)
+            shown += _DETAIL_PAGE_SIZE
+            if shown >= len(papers):
+                more_button.delete()
+
+        more_button = ui.button("Show more", on_click=show_more).props("flat")
+        show_more()
+
+    def _render_paper_card(self, paper: dict[str, Any]) -> None:
+        """Render a single paper card for the detail view."""
+        with ui.card().classes("w-full mb-4 card-hover"):
+            # Title with link
+            with ui.link(target=paper["link"]).classes("no-underline text-inherit"):
+                ui.label(paper["title"]).classes(_PAPER_TITLE_CLS)
+
+            # Authors
+            if "authors" in paper["extra"]:
+                ui.label(", ".join(paper["extra"]["authors"])).classes(_AUTHORS_CLS)
+
+            # Publication date
+            ui.label(f"Published: {paper['extra']['published_date']}").classes(
+                _PUBLISHED_CLS
+            )
+
+            # Summary
+            ui.label(paper["summary"]).classes(_SUMMARY_CLS)
+
+            # Tags
+            with ui.row().classes("mt-2"):
+                for tag in paper["tags"]:
+                    ui.chip(tag).classes("mr-1")
+
+            # Action button
+            with ui.row().classes("w-full justify-end mt-2"):
+                ui.button(
+                    "View on ArXiv",
+                    on_click=lambda link=paper["link"]: ui.run_javascript(
+                        f'window.open("{link}", "_blank")'
+                    ),
+                ).props("outline")
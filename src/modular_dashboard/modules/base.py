@@ -1,10 +1,19 @@
 """Module base class."""
 
+import asyncio
+import atexit
+import threading
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import Awaitable, Callable
+from typing import Any, ClassVar, TypeVar
+from urllib.parse import urlsplit
+
+import httpx
 
 from ..utils.storage import CachedStorage, StorageBackend, get_storage_manager
 
+_T = TypeVar("_T")
+
 
 class Module(ABC):
     """Base class for all dashboard modules.
@@ -27,11 +36,23 @@ class Module(ABC):
         settings that affect behavior and presentation.
     """
 
+    # HTTP clients shared by all modules, one per host, so keep-alive
+    # connections survive across fetches, refreshes and module instances
+    _http_clients: ClassVar[dict[str, httpx.Client]] = {}
+    _http_clients_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    # Coroutines currently running through coalesce_async(), keyed by module
+    # ID and key; only touched from the event loop thread, so no lock is needed
+    _async_inflight: ClassVar[dict[str, asyncio.Future]] = {}
+
+    # Subclasses that add instance attributes without declaring their own
+    # __slots__ simply fall back to a per-instance __dict__
+    __slots__ = ("config", "_storage", "_cache")
+
     def __init__(self, config: dict[str, Any] | None = None):
         self.config = config or {}
         self._storage: StorageBackend | None = None
         self._cache: CachedStorage | None = None
-        self._storage_manager = get_storage_manager()
 
     def get_storage(self) -> StorageBackend:
         """Get module-specific storage backend.
@@ -46,7 +67,7 @@ class Module(ABC):
             Module-specific storage backend instance.
         """
         if self._storage is None:
-            self._storage = self._storage_manager.get_module_storage(self.id)
+            self._storage = get_storage_manager().get_module_storage(self.id)
         return self._storage
 
     def get_cache(self, default_ttl: int = 3600) -> CachedStorage:
@@ -66,7 +87,9 @@ class Module(ABC):
             Module-specific cached storage backend instance.
         """
         if self._cache is None:
-            self._cache = self._storage_manager.get_module_cache(self.id, default_ttl)
+            # The storage manager is only needed here and in get_storage(), so
+            # constructing a module never touches it
+            self._cache = get_storage_manager().get_module_cache(self.id, default_ttl)
 
             # Apply module-specific cache limits from config
             max_entries = self.config.get("max_cache_entries")
@@ -75,6 +98,81 @@ class Module(ABC):
 
         return self._cache
 
+    @classmethod
+    def get_http_client(cls, url: str) -> httpx.Client:
+        """Get the shared HTTP client for the host of a URL.
+
+        Clients are pooled per host and shared by every module, so
+        repeated requests reuse open connections instead of paying for a
+        new TCP and TLS handshake each time. They are closed when the
+        process exits; callers must not close them.
+
+        Parameters
+        ----------
+        url : str
+            Any URL on the host to get a client for.
+
+        Returns
+        -------
+        httpx.Client
+            Pooled client for the URL's host.
+        """
+        host = urlsplit(url).netloc
+        client = Module._http_clients.get(host)
+        if client is None:
+            with Module._http_clients_lock:
+                client = Module._http_clients.get(host)
+                if client is None:
+                    client = httpx.Client(
+                        timeout=10.0,
+                        limits=httpx.Limits(max_connections=32, keepalive_expiry=60),
+                    )
+                    Module._http_clients[host] = client
+        return client
+
+    async def coalesce_async(self, key: str, func: Callable[[], Awaitable[_T]]) -> _T:
+        """Await ``func()`` once for concurrent callers sharing the same key.
+
+        The first caller awaits ``func()``; callers arriving while it is
+        still running await its result (or exception) instead of starting
+        the work again. Use this around cache misses so an expired entry
+        doesn't trigger duplicate requests.
+
+        Parameters
+        ----------
+        key : str
+            Identifies the work within this module.
+        func : Callable[[], Awaitable[Any]]
+            Coroutine function doing the work.
+
+        Returns
+        -------
+        Any
+            The result of ``func()``.
+        """
+        inflight_key = f"{self.id}:{key}"
+        future = Module._async_inflight.get(inflight_key)
+        if future is not None:
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        Module._async_inflight[inflight_key] = future
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark it retrieved so a call nobody else waited on isn't logged
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del Module._async_inflight[inflight_key]
+
     def has_persistence(self) -> bool:
         """Check if module requires persistent storage.
 
@@ -108,6 +206,7 @@ class Module(ABC):
         expired cache entries. This method is called automatically
         during update operations and module shutdown.
         """
+        # Pooled HTTP clients are shared with other modules and stay open
         if self._cache:
             self._cache.cleanup_expired()
 
@@ -326,3 +425,12 @@ class Module(ABC):
         module to see more detailed information.
         """
         self.render()
+
+
+@atexit.register
+def _close_http_clients() -> None:
+    """Close the pooled HTTP clients when the process exits."""
+    with Module._http_clients_lock:
+        for client in Module._http_clients.values():
+            client.close()
+        Module._http_clients.clear()
@@ -1,109 +1,291 @@
 """Clock module for displaying current time and date."""
 
 import asyncio
-from datetime import datetime
-from typing import Any
+import functools
+import html
+import json
+import operator
+import time
+import weakref
+from collections.abc import Callable
+from datetime import UTC, date, datetime, tzinfo
+from typing import Any, ClassVar
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-from nicegui import ui
+from loguru import logger
+from nicegui import Client, ui
 
 from ...ui.styles import DashboardStyles
 from ..extended import ExtendedModule
 
+# Composite class strings shared by render() and render_detail()
+_COLUMN_CLS = f"{DashboardStyles.FULL_WIDTH} {DashboardStyles.CENTER_CONTENT} {DashboardStyles.GAP_SM}"
+_DETAIL_COLUMN_CLS = f"{DashboardStyles.FULL_WIDTH} {DashboardStyles.GAP_LG} max-w-2xl mx-auto {DashboardStyles.CENTER_CONTENT}"
+_HEADING_CLS = DashboardStyles.TITLE_H1 + " text-center"
+_SUBHEADING_CLS = DashboardStyles.TITLE_H2 + " mt-4"
+_TIME_CLS = DashboardStyles.TITLE_H1 + " text-blue-600 tabular-nums"
+_DATE_CLS = DashboardStyles.TITLE_H2 + " text-gray-600 text-center"
+_DETAIL_DATE_CLS = DashboardStyles.TITLE_H2 + " text-gray-600 mt-4"
+_MAIN_CARD_CLS = (
+    f"{DashboardStyles.FULL_WIDTH} {DashboardStyles.PADDING_XL} text-center"
+)
+_INFO_CARD_CLS = (
+    f"{DashboardStyles.FULL_WIDTH} {DashboardStyles.PADDING_MD} text-center"
+)
+_INFO_ROW_CLS = f"{DashboardStyles.FULL_WIDTH} {DashboardStyles.CENTER_CONTENT} {DashboardStyles.GAP_SM} flex flex-wrap text-sm"
+_ZONE_CARD_CLS = f"{DashboardStyles.PADDING_MD} text-center min-w-[150px]"
+_ZONE_NAME_CLS = DashboardStyles.FONT_SEMIBOLD + " text-gray-600"
+_ZONE_TIME_CLS = DashboardStyles.TITLE_H2 + " font-bold"
+
+
+def _format_hms(dt: datetime) -> str:
+    """Format a 24-hour time with seconds without going through strftime."""
+    return f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+
+
+def _format_hm(dt: datetime) -> str:
+    """Format a 24-hour time without seconds without going through strftime."""
+    return f"{dt.hour:02d}:{dt.minute:02d}"
+
+
+# Ticks a time label in the browser, so the server sends nothing per second.
+# Each call re-formats at the next multiple of the period and stops once the
+# element has left the page.
+_CLOCK_JS = """
+window.mdClock ??= (id, options, period) => {
+  const el = document.getElementById(id);
+  if (!el) return;
+  const format = new Intl.DateTimeFormat("en-US", options);
+  const step = () => {
+    if (!el.isConnected) return;
+    el.textContent = format.format(new Date());
+    setTimeout(step, period - (Date.now() % period));
+  };
+  step();
+};
+"""
+
+
+@functools.lru_cache(maxsize=8)
+def _format_day(day: date, fmt: str) -> str:
+    """Format a calendar day; the result is the same for every tick that day."""
+    return day.strftime(fmt)
+
 
 class ClockModule(ExtendedModule):
     """Clock module for displaying current time and date."""
 
+    __slots__ = (
+        "_date_labels",
+        "_last_date",
+        "timezone",
+        "_tzinfo",
+        "format_24h",
+        "show_seconds",
+        "update_interval",
+        "_time_fmt",
+        "_time_formatter",
+        "_time_js_args",
+        "_date_fmt",
+        "__weakref__",
+    )
+
+    # One ticker task keeps the date of every clock instance and view
+    # current; it stops once the last view is gone and restarts on the next
+    # render. The time itself ticks in the browser.
+    _subscribers: ClassVar[weakref.WeakSet["ClockModule"]] = weakref.WeakSet()
+    _ticker: ClassVar[asyncio.Task | None] = None
+    # Clients whose visibility is tracked, and those currently hidden or
+    # disconnected; their views are skipped until they are visible again
+    _watched_clients: ClassVar[set[str]] = set()
+    _hidden_clients: ClassVar[set[str]] = set()
+
+    id = "clock"
+    name = "Clock"
+    icon = "schedule"
+    description = "Display current time and date"
+    version = "1.0.0"
+
     def __init__(self, config: dict[str, Any] | None = None):
         super().__init__(config)
-        self.time_label = None
-        self.date_label = None
+        # Date label of every rendered view, grouped by client, so the
+        # dashboard card and the detail page update together
+        self._date_labels: dict[str, list[ui.label]] = {}
+        self._last_date: date | None = None
         self.timezone = self.config.get("timezone", "local")
+        self._tzinfo = self._resolve_tzinfo(self.timezone)
         self.format_24h = self.config.get("format_24h", False)
         self.show_seconds = self.config.get("show_seconds", True)
         self.update_interval = self.config.get("update_interval", 1)
 
-    @property
-    def id(self) -> str:
-        return "clock"
-
-    @property
-    def name(self) -> str:
-        return "Clock"
+        # Resolve the format strings once instead of on every tick
+        if self.format_24h:
+            self._time_fmt = "%H:%M:%S" if self.show_seconds else "%H:%M"
+        else:
+            self._time_fmt = "%I:%M:%S %p" if self.show_seconds else "%I:%M %p"
+        self._date_fmt = self.config.get("date_format", "%A, %B %d, %Y")
 
-    @property
-    def icon(self) -> str:
-        return "schedule"
+        # The 24-hour formats are plain zero-padded fields, which an f-string
+        # builds faster than strftime; 12-hour formats need the locale's AM/PM
+        self._time_formatter: Callable[[datetime], str]
+        if self.format_24h:
+            self._time_formatter = _format_hms if self.show_seconds else _format_hm
+        else:
+            self._time_formatter = operator.methodcaller("strftime", self._time_fmt)
 
-    @property
-    def description(self) -> str:
-        return "Display current time and date"
+        # Intl.DateTimeFormat options matching _time_fmt, and the browser
+        # tick period in milliseconds
+        options = {
+            "hour": "2-digit",
+            "minute": "2-digit",
+            "hourCycle": "h23" if self.format_24h else "h12",
+        }
+        if self.show_seconds:
+            options["second"] = "2-digit"
+        if self._tzinfo is not None:
+            options["timeZone"] = str(self._tzinfo)
+        period = max(1, round(self.update_interval * 1000))
+        self._time_js_args = f"{json.dumps(options)}, {period}"
 
-    @property
-    def version(self) -> str:
-        return "1.0.0"
+    @staticmethod
+    def _resolve_tzinfo(name: str) -> tzinfo | None:
+        """Resolve a timezone setting to a tzinfo; None means local time."""
+        if name == "local":
+            return None
+        if name.lower() == "utc":
+            return UTC
+        try:
+            return ZoneInfo(name)
+        except (ZoneInfoNotFoundError, ValueError):
+            logger.warning(f"Unknown timezone {name!r}, using local time")
+            return None
 
     def _get_current_time(self) -> datetime:
         """Get current time based on timezone setting."""
-        if self.timezone == "utc":
-            return datetime.utcnow()
-        else:
-            return datetime.now()
+        return datetime.now(self._tzinfo)
 
     def _format_time(self, dt: datetime) -> str:
         """Format time according to settings."""
-        if self.format_24h:
-            time_format = "%H:%M"
-            if self.show_seconds:
-                time_format = "%H:%M:%S"
-        else:
-            time_format = "%I:%M"
-            if self.show_seconds:
-                time_format = "%I:%M:%S"
-
-        time_str = dt.strftime(time_format)
-        if not self.format_24h:
-            time_str += dt.strftime(" %p")
-
-        return time_str
+        return self._time_formatter(dt)
 
     def _format_date(self, dt: datetime) -> str:
         """Format date according to settings."""
-        date_format = self.config.get("date_format", "%A, %B %d, %Y")
-        return dt.strftime(date_format)
+        return _format_day(dt.date(), self._date_fmt)
+
+    def _add_labels(self, time_label: ui.label, date_label: ui.label) -> None:
+        """Start a view's time ticking in the browser and track its date."""
+        ui.run_javascript(
+            f"{_CLOCK_JS} mdClock('c{time_label.id}', {self._time_js_args});"
+        )
+
+        client = ui.context.client
+        self._date_labels.setdefault(client.id, []).append(date_label)
+        if client.id not in ClockModule._watched_clients:
+            ClockModule._watch_client(client)
+        ClockModule._subscribers.add(self)
+        if ClockModule._ticker is None or ClockModule._ticker.done():
+            ClockModule._ticker = asyncio.create_task(ClockModule._run_ticker())
+
+    @staticmethod
+    def _watch_client(client: Client) -> None:
+        """Pause a client's views while its tab is hidden or disconnected."""
+        client_id = client.id
+        ClockModule._watched_clients.add(client_id)
+        # Treat the client as hidden until its websocket connects, so a page
+        # that never connects is still cleaned up
+        ClockModule._hidden_clients.add(client_id)
 
-    async def _update_clock(self) -> None:
-        """Update the clock display."""
+        def set_visible(visible: bool) -> None:
+            if not visible:
+                ClockModule._hidden_clients.add(client_id)
+                return
+            ClockModule._hidden_clients.discard(client_id)
+            # Views of this client may have missed a date change while
+            # hidden; push the current date right away
+            for module in list(ClockModule._subscribers):
+                module._last_date = None
+                module._tick()
+
+        client.on_connect(lambda: set_visible(True))
+        client.on_disconnect(lambda: set_visible(False))
+        ui.on("clock_visibility", lambda e: set_visible(bool(e.args)))
+        ui.run_javascript(
+            "document.addEventListener('visibilitychange', () => "
+            "emitEvent('clock_visibility', document.visibilityState === 'visible'))"
+        )
+
+    @staticmethod
+    async def _run_ticker() -> None:
+        """Keep every clock's date current until no views are left."""
+        subscribers = ClockModule._subscribers
+        hidden = ClockModule._hidden_clients
         while True:
-            try:
-                if (
-                    self.time_label
-                    and hasattr(self.time_label, "client")
-                    and self.time_label.client
-                    and self.date_label
-                    and hasattr(self.date_label, "client")
-                    and self.date_label.client
-                ):
-                    now = self._get_current_time()
-                    self.time_label.text = self._format_time(now)
-                    self.date_label.text = self._format_date(now)
-            except (RuntimeError, AttributeError):
-                # Client disconnected, stop updating
-                break
-            await asyncio.sleep(self.update_interval)
+            # Only hidden (or disconnected) clients can have gone away; forget
+            # their views once NiceGUI has deleted the client
+            gone = [cid for cid in hidden if cid not in Client.instances]
+            if gone:
+                for module in subscribers:
+                    for client_id in gone:
+                        module._date_labels.pop(client_id, None)
+                hidden.difference_update(gone)
+                ClockModule._watched_clients.difference_update(gone)
+
+            for module in list(subscribers):
+                try:
+                    alive = module._tick()
+                except Exception as e:
+                    logger.warning(f"Clock update failed: {e}")
+                    alive = False
+                if not alive:
+                    subscribers.discard(module)
+            if not subscribers:
+                return
+            # Days start on a minute boundary in every timezone, so waking at
+            # the top of each minute catches the change without drifting
+            await asyncio.sleep(60 - time.time() % 60)
+
+    def _tick(self) -> bool:
+        """Push the date to every visible view of this clock if it changed.
+
+        Returns
+        -------
+        bool
+            False once all of this clock's views have gone away.
+        """
+        date_labels = self._date_labels
+        if not date_labels:
+            return False
+
+        now = self._get_current_time()
+        today = now.date()
+        if today == self._last_date:
+            return True
+        self._last_date = today
+        date_text = self._format_date(now)
+
+        hidden = ClockModule._hidden_clients
+        for client_id, labels in date_labels.items():
+            if client_id in hidden:
+                continue
+            for date_label in labels:
+                date_label.text = date_text
+        return True
 
     def fetch(self) -> list[dict[str, Any]]:
         """Fetch current time data."""
         now = self._get_current_time()
+        time_text = self._format_time(now)
+        date_text = self._format_date(now)
         return [
             {
                 "title": "Current Time",
-                "summary": f"{self._format_time(now)} - {self._format_date(now)}",
+                "summary": f"{time_text} - {date_text}",
                 "link": "",
                 "published": now.isoformat(),
                 "tags": ["time", "clock"],
                 "extra": {
-                    "time": self._format_time(now),
-                    "date": self._format_date(now),
+                    "time": time_text,
+                    "date": date_text,
                     "timezone": self.timezone,
                     "format_24h": self.format_24h,
                     "show_seconds": self.show_seconds,
@@ -115,90 +297,62 @@ class ClockModule(ExtendedModule):
         """Render the clock module UI."""
         now = self._get_current_time()
 
-        with ui.column().classes(
-            f"{DashboardStyles.FULL_WIDTH} {DashboardStyles.CENTER_CONTENT} {DashboardStyles.GAP_SM}"
-        ):
+        with ui.column().classes(_COLUMN_CLS):
             # Time display
-            self.time_label = ui.label(self._format_time(now)).classes(
-                DashboardStyles.TITLE_H1 + " text-blue-600 tabular-nums"
-            )
+            time_label = ui.label(self._format_time(now)).classes(_TIME_CLS)
 
             # Date display
-            self.date_label = ui.label(self._format_date(now)).classes(
-                DashboardStyles.TITLE_H2 + " text-gray-600 text-center"
-            )
+            date_label = ui.label(self._format_date(now)).classes(_DATE_CLS)
 
-            # Start the clock update loop
-            ui.timer(self.update_interval, self._update_clock)
+            self._add_labels(time_label, date_label)
 
     def render_detail(self) -> None:
         """Render detailed clock view."""
         now = self._get_current_time()
 
-        with ui.column().classes(
-            f"{DashboardStyles.FULL_WIDTH} {DashboardStyles.GAP_LG} max-w-2xl mx-auto {DashboardStyles.CENTER_CONTENT}"
-        ):
-            ui.label("World Clock").classes(DashboardStyles.TITLE_H1 + " text-center")
+        with ui.column().classes(_DETAIL_COLUMN_CLS):
+            ui.label("World Clock").classes(_HEADING_CLS)
 
             # Main clock display
-            with ui.card().classes(
-                f"{DashboardStyles.FULL_WIDTH} {DashboardStyles.PADDING_XL} text-center"
-            ):
-                self.time_label = ui.label(self._format_time(now)).classes(
-                    DashboardStyles.TITLE_H1 + " text-blue-600 tabular-nums"
-                )
+            with ui.card().classes(_MAIN_CARD_CLS):
+                time_label = ui.label(self._format_time(now)).classes(_TIME_CLS)
 
-                self.date_label = ui.label(self._format_date(now)).classes(
-                    DashboardStyles.TITLE_H2 + " text-gray-600 mt-4"
-                )
+                date_label = ui.label(self._format_date(now)).classes(_DETAIL_DATE_CLS)
+                self._add_labels(time_label, date_label)
 
             # Time zone info
-            with (
-                ui.card().classes(
-                    f"{DashboardStyles.FULL_WIDTH} {DashboardStyles.PADDING_MD} text-center"
-                ),
-                ui.row().classes(
-                    f"{DashboardStyles.FULL_WIDTH} {DashboardStyles.CENTER_CONTENT} {DashboardStyles.GAP_SM} text-sm"
-                ),
-            ):
-                ui.label(f"Timezone: {self.timezone.upper()}")
-                ui.label(f"Format: {'24-hour' if self.format_24h else '12-hour'}")
-                if self.show_seconds:
-                    ui.label("Show: Seconds")
+            info = [
+                f"Timezone: {self.timezone.upper()}",
+                f"Format: {'24-hour' if self.format_24h else '12-hour'}",
+            ]
+            if self.show_seconds:
+                info.append("Show: Seconds")
+            with ui.card().classes(_INFO_CARD_CLS):
+                ui.html(
+                    "".join(f"<span>{html.escape(text)}</span>" for text in info)
+                ).classes(_INFO_ROW_CLS)
 
             # Additional time zones
-            ui.label("Other Time Zones").classes(DashboardStyles.TITLE_H2 + " mt-4")
+            ui.label("Other Time Zones").classes(_SUBHEADING_CLS)
+
+            # Show the instant the main display was rendered with, rather
+            # than reading the clock again for each zone
+            utc_time = now.astimezone(UTC)
+            local_time = now.astimezone()
 
             with ui.row().classes("w-full gap-4 justify-center"):
                 # Local time
-                local_time = datetime.now()
-                with ui.card().classes(
-                    f"{DashboardStyles.PADDING_MD} text-center min-w-[150px]"
-                ):
-                    ui.label("Local").classes(
-                        DashboardStyles.FONT_SEMIBOLD + " text-gray-600"
-                    )
-                    ui.label(local_time.strftime("%H:%M")).classes(
-                        DashboardStyles.TITLE_H2 + " font-bold"
-                    )
+                with ui.card().classes(_ZONE_CARD_CLS):
+                    ui.label("Local").classes(_ZONE_NAME_CLS)
+                    ui.label(local_time.strftime("%H:%M")).classes(_ZONE_TIME_CLS)
                     ui.label(local_time.strftime("%Y-%m-%d")).classes(
                         DashboardStyles.SUBTLE_TEXT
                     )
 
                 # UTC time
-                utc_time = datetime.utcnow()
-                with ui.card().classes(
-                    f"{DashboardStyles.PADDING_MD} text-center min-w-[150px]"
-                ):
-                    ui.label("UTC").classes(
-                        DashboardStyles.FONT_SEMIBOLD + " text-gray-600"
-                    )
-                    ui.label(utc_time.strftime("%H:%M")).classes(
-                        DashboardStyles.TITLE_H2 + " font-bold"
-                    )
+                with ui.card().classes(_ZONE_CARD_CLS):
+                    ui.label("UTC").classes(_ZONE_NAME_CLS)
+                    ui.label(utc_time.strftime("%H:%M")).classes(_ZONE_TIME_CLS)
                     ui.label(utc_time.strftime("%Y-%m-%d")).classes(
                         DashboardStyles.SUBTLE_TEXT
                     )
-
-            # Start the clock update loop
-            ui.timer(self.update_interval, self._update_clock)
@@ -1,15 +1,95 @@
 """Extended module base class with extended functionality."""
 
-from collections.abc import Callable
+import asyncio
+import csv
+import html
+import io
+import json
+from collections.abc import Callable, Iterator, Mapping, Sequence
 from datetime import datetime
-from typing import Any
+from types import MappingProxyType
+from typing import Any, NamedTuple
 
 from loguru import logger
 from nicegui import ui
 
+from ..utils.json_utils import dumps_indented
 from .base import Module
 
 
+class _ConfigField(NamedTuple):
+    """A config schema field, compiled once for render_config_ui."""
+
+    name: str
+    label: str
+    description: str
+    default: Any
+    options: list[Any]
+    render: Callable[["_ConfigField", dict[str, Any]], None]
+
+
+def _render_string_field(field: _ConfigField, config: dict[str, Any]) -> None:
+    ui.input(
+        placeholder=field.label,
+        value=config.get(field.name, field.default),
+    ).classes("w-full").bind_value(config, field.name)
+
+
+def _render_number_field(field: _ConfigField, config: dict[str, Any]) -> None:
+    ui.number(
+        label=field.label,
+        value=config.get(field.name, field.default),
+    ).classes("w-full").bind_value(config, field.name)
+
+
+def _render_boolean_field(field: _ConfigField, config: dict[str, Any]) -> None:
+    ui.switch(
+        text=field.label,
+        value=config.get(field.name, field.default),
+    ).bind_value(config, field.name)
+
+
+def _render_select_field(field: _ConfigField, config: dict[str, Any]) -> None:
+    ui.select(
+        options=field.options,
+        label=field.label,
+        value=config.get(field.name, field.default),
+    ).classes("w-full").bind_value(config, field.name)
+
+
+def _render_unknown_field(field: _ConfigField, config: dict[str, Any]) -> None:
+    pass
+
+
+_FIELD_RENDERERS: dict[str, Callable[[_ConfigField, dict[str, Any]], None]] = {
+    "string": _render_string_field,
+    "number": _render_number_field,
+    "boolean": _render_boolean_field,
+    "select": _render_select_field,
+}
+
+# Shared defaults for modules that declare no features or config schema
+_NO_FEATURES: tuple[str, ...] = ()
+_NO_CONFIG_SCHEMA: Mapping[str, Any] = MappingProxyType({})
+
+
+# Format of the last fetch/error times shown by render_stats_ui()
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+# Compiled config schema per module class; schemas are static per class
+_CONFIG_FIELDS: dict[type, tuple[_ConfigField, ...]] = {}
+
+
+def open_in_new_tab(js: str) -> None:
+    """Run a prebuilt ``window.open`` call in the browser.
+
+    Bind it with ``functools.partial`` as a click handler so rows don't
+    each need their own closure.
+    """
+    ui.run_javascript(js)
+
+
 class ExtendedModule(Module):
     """Extended module with additional functionality.
 
@@ -29,10 +109,21 @@ class ExtendedModule(Module):
         Configuration dictionary for the module.
     """
 
+    __slots__ = (
+        "_refresh_callbacks",
+        "_error_handlers",
+        "_is_initialized",
+        "_last_error",
+        "_stats",
+        "_stats_view",
+    )
+
     def __init__(self, config: dict[str, Any] | None = None):
         super().__init__(config)
-        self._refresh_callbacks: list[Callable] = []
-        self._error_handlers: list[Callable] = []
+        # Tuples, replaced on registration, so notifying iterates a stable
+        # snapshot even if a callback registers another one
+        self._refresh_callbacks: tuple[Callable, ...] = ()
+        self._error_handlers: tuple[Callable, ...] = ()
         self._is_initialized = False
         self._last_error: Exception | None = None
         self._stats: dict[str, Any] = {
@@ -40,7 +131,10 @@ class ExtendedModule(Module):
             "error_count": 0,
             "last_fetch": None,
             "last_error": None,
+            "last_fetch_str": None,
+            "last_error_str": None,
         }
+        self._stats_view = MappingProxyType(self._stats)
 
     @property
     def version(self) -> str:
@@ -71,25 +165,27 @@ class ExtendedModule(Module):
         return "general"
 
     @property
-    def supported_features(self) -> list[str]:
+    def supported_features(self) -> Sequence[str]:
         """List of supported features.
 
         Returns a list of feature identifiers that this module supports.
         Can be used by the UI to enable/disable certain functionality.
+        The default is a shared empty tuple and must not be modified.
 
         Returns
         -------
-        list[str]
-            List of supported feature identifiers.
+        Sequence[str]
+            Supported feature identifiers.
         """
-        return []
+        return _NO_FEATURES
 
     def get_default_config(self) -> dict[str, Any]:
         """Get default configuration for the module.
 
         Returns the default configuration values for this module.
         Subclasses should override this to provide module-specific
-        default values.
+        default values. Callers may update the result in place, so it
+        must be a new dict on every call.
 
         Returns
         -------
@@ -117,19 +213,19 @@ class ExtendedModule(Module):
         """
         return True
 
-    def get_config_schema(self) -> dict[str, Any]:
+    def get_config_schema(self) -> Mapping[str, Any]:
         """Get configuration schema for UI generation.
 
         Returns a schema describing the configuration options for this
         module. This schema is used to automatically generate configuration
-        UI elements.
+        UI elements. The default is a shared read-only empty mapping.
 
         Returns
         -------
-        dict[str, Any]
+        Mapping[str, Any]
             Configuration schema with field definitions.
         """
-        return {}
+        return _NO_CONFIG_SCHEMA
 
     def add_refresh_callback(self, callback: Callable) -> None:
         """Add a callback to be called when data is refreshed.
@@ -142,7 +238,7 @@ class ExtendedModule(Module):
         callback : Callable
             Function to call when data is refreshed.
         """
-        self._refresh_callbacks.append(callback)
+        self._refresh_callbacks = (*self._refresh_callbacks, callback)
 
     def add_error_handler(self, handler: Callable) -> None:
         """Add an error handler.
@@ -155,7 +251,7 @@ class ExtendedModule(Module):
         handler : Callable
             Function to call when an error occurs.
         """
-        self._error_handlers.append(handler)
+        self._error_handlers = (*self._error_handlers, handler)
 
     def _notify_refresh(self) -> None:
         """Notify all refresh callbacks.
@@ -182,7 +278,9 @@ class ExtendedModule(Module):
         """
         self._last_error = error
         self._stats["error_count"] += 1
-        self._stats["last_error"] = datetime.now()
+        now = datetime.now()
+        self._stats["last_error"] = now
+        self._stats["last_error_str"] = now.strftime(_TIMESTAMP_FORMAT)
 
         for handler in self._error_handlers:
             try:
@@ -190,60 +288,69 @@ class ExtendedModule(Module):
             except Exception as e:
                 logger.error(f"Error in error handler: {e}")
 
-    def get_stats(self) -> dict[str, Any]:
+    def get_stats(self) -> Mapping[str, Any]:
         """Get module statistics.
 
-        Returns a copy of the module's internal statistics.
+        Returns a read-only live view of the module's internal statistics;
+        copy it with ``dict(...)`` to keep a snapshot.
 
         Returns
         -------
-        dict[str, Any]
-            Dictionary containing module statistics:
+        Mapping[str, Any]
+            Mapping containing module statistics:
             - fetch_count: Number of successful fetch operations
             - error_count: Number of errors encountered
             - last_fetch: Timestamp of last successful fetch
             - last_error: Timestamp of last error
+            - last_fetch_str, last_error_str: The same timestamps formatted
+              for display
         """
-        return self._stats.copy()
+        return self._stats_view
 
     def reset_stats(self) -> None:
         """Reset module statistics.
 
         Reset all statistics counters to their initial values.
         """
-        self._stats = {
-            "fetch_count": 0,
-            "error_count": 0,
-            "last_fetch": None,
-            "last_error": None,
-        }
+        # Updated in place so the view returned by get_stats() stays valid
+        self._stats.update(
+            fetch_count=0,
+            error_count=0,
+            last_fetch=None,
+            last_error=None,
+            last_fetch_str=None,
+            last_error_str=None,
+        )
 
     async def async_fetch(self) -> list[dict[str, Any]]:
         """Async version of fetch method.
 
         Asynchronous version of the fetch method that can be used
-        in async contexts.
+        in async contexts. The synchronous fetch runs in a worker thread
+        so it doesn't block the event loop.
 
         Returns
         -------
         list[dict[str, Any]]
             List of items returned by the fetch method.
         """
-        return self.fetch()
+        return await asyncio.to_thread(self.fetch)
 
-    def fetch_with_retry(
+    async def fetch_with_retry(
         self, max_retries: int = 3, retry_delay: float = 1.0
     ) -> list[dict[str, Any]]:
         """Fetch data with retry logic.
 
-        Attempt to fetch data with automatic retries on failure.
+        Attempt to fetch data with automatic retries on failure. The delay
+        doubles after each failed attempt, and waiting never blocks the
+        event loop.
 
         Parameters
         ----------
         max_retries : int, default=3
             Maximum number of retry attempts.
         retry_delay : float, default=1.0
-            Delay in seconds between retry attempts.
+            Delay in seconds before the first retry.
 
         Returns
         -------
@@ -257,18 +364,18 @@ class ExtendedModule(Module):
         """
         for attempt in range(max_retries):
             try:
-                result = self.fetch()
+                result = await self.async_fetch()
                 self._stats["fetch_count"] += 1
-                self._stats["last_fetch"] = datetime.now()
+                now = datetime.now()
+                self._stats["last_fetch"] = now
+                self._stats["last_fetch_str"] = now.strftime(_TIMESTAMP_FORMAT)
                 return result
             except Exception as e:
                 if attempt == max_retries - 1:
                     self._handle_error(e)
                     raise
                 logger.warning(f"Fetch attempt {attempt + 1} failed, retrying...")
-                import time
-
-                time.sleep(retry_delay)
+                await asyncio.sleep(retry_delay * 2**attempt)
 
         return []
 
@@ -336,25 +443,44 @@ class ExtendedModule(Module):
         ValueError
             If an unsupported format is specified.
         """
-        data = self.fetch()
-
         if format == "json":
-            import json
-
-            return json.dumps(data, indent=2, ensure_ascii=False)
+            data = self.fetch()
+            return dumps_indented(data).decode()
         elif format == "csv":
-            import csv
-            import io
-
-            output = io.StringIO()
-            if data:
-                writer = csv.DictWriter(output, fieldnames=data[0].keys())
-                writer.writeheader()
-                writer.writerows(data)
-            return output.getvalue()
+            return "".join(self.export_data_iter())
         else:
             raise ValueError(f"Unsupported export format: {format}")
 
+    def export_data_iter(self) -> Iterator[str]:
+        """Export module data as CSV, one line at a time.
+
+        Yields the header and then each row as it is written, so callers
+        that stream the export never hold the whole CSV in memory.
+
+        Yields
+        ------
+        str
+            CSV-formatted lines, each including its line terminator.
+        """
+        data = self.fetch()
+        if not data:
+            return
+
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=data[0].keys())
+
+        def flush() -> str:
+            line = buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            return line
+
+        writer.writeheader()
+        yield flush()
+        for row in data:
+            writer.writerow(row)
+            yield flush()
+
     def import_data(self, data: Any, format: str = "json") -> bool:
         """Import module data from specified format.
 
@@ -374,8 +500,6 @@ class ExtendedModule(Module):
         """
         try:
             if format == "json":
-                import json
-
                 parsed_data = json.loads(data)
                 self._process_imported_data(parsed_data)
                 return True
@@ -405,48 +529,42 @@ class ExtendedModule(Module):
         the configuration schema to automatically generate
         appropriate input elements.
         """
-        schema = self.get_config_schema()
-        if not schema:
+        fields = self._config_fields()
+        if not fields:
             ui.label("No configuration available").classes("text-gray-500")
             return
 
+        config = self.config
         with ui.card().classes("w-full p-4"):
             ui.label("Module Configuration").classes("text-lg font-semibold mb-4")
 
             # Render configuration fields based on schema
-            for field_name, field_config in schema.items():
-                field_type = field_config.get("type", "string")
-                field_label = field_config.get("label", field_name)
-                field_default = field_config.get("default", "")
-                field_description = field_config.get("description", "")
-
+            for field in fields:
                 with ui.column().classes("w-full gap-2 mb-4"):
-                    ui.label(field_label).classes("text-sm font-medium")
-                    if field_description:
-                        ui.label(field_description).classes("text-xs text-gray-500")
-
-                    if field_type == "string":
-                        ui.input(
-                            placeholder=field_label,
-                            value=self.config.get(field_name, field_default),
-                        ).classes("w-full").bind_value(self.config, field_name)
-                    elif field_type == "number":
-                        ui.number(
-                            label=field_label,
-                            value=self.config.get(field_name, field_default),
-                        ).classes("w-full").bind_value(self.config, field_name)
-                    elif field_type == "boolean":
-                        ui.switch(
-                            text=field_label,
-                            value=self.config.get(field_name, field_default),
-                        ).bind_value(self.config, field_name)
-                    elif field_type == "select":
-                        options = field_config.get("options", [])
-                        ui.select(
-                            options=options,
-                            label=field_label,
-                            value=self.config.get(field_name, field_default),
-                        ).classes("w-full").bind_value(self.config, field_name)
+                    ui.label(field.label).classes("text-sm font-medium")
+                    if field.description:
+                        ui.label(field.description).classes("text-xs text-gray-500")
+                    field.render(field, config)
+
+    def _config_fields(self) -> tuple[_ConfigField, ...]:
+        """Return this module's config schema compiled into render-ready fields."""
+        cls = type(self)
+        fields = _CONFIG_FIELDS.get(cls)
+        if fields is None:
+            fields = _CONFIG_FIELDS[cls] = tuple(
+                _ConfigField(
+                    name=field_name,
+                    label=field_config.get("label", field_name),
+                    description=field_config.get("description", ""),
+                    default=field_config.get("default", ""),
+                    options=field_config.get("options", []),
+                    render=_FIELD_RENDERERS.get(
+                        field_config.get("type", "string"), _render_unknown_field
+                    ),
+                )
+                for field_name, field_config in self.get_config_schema().items()
+            )
+        return fields
 
     def render_stats_ui(self) -> None:
         """Render statistics UI for the module.
@@ -459,24 +577,21 @@ class ExtendedModule(Module):
         with ui.card().classes("w-full p-4"):
             ui.label("Module Statistics").classes("text-lg font-semibold mb-4")
 
-            with ui.column().classes("w-full gap-2"):
-                ui.label(f"Fetch Count: {stats['fetch_count']}").classes("text-sm")
-                ui.label(f"Error Count: {stats['error_count']}").classes("text-sm")
-
-                if stats["last_fetch"]:
-                    ui.label(
-                        f"Last Fetch: {stats['last_fetch'].strftime('%Y-%m-%d %H:%M:%S')}"
-                    ).classes("text-sm")
-
-                if stats["last_error"]:
-                    ui.label(
-                        f"Last Error: {stats['last_error'].strftime('%Y-%m-%d %H:%M:%S')}"
-                    ).classes("text-sm")
-
-                if self._last_error:
-                    ui.label(f"Error: {str(self._last_error)}").classes(
-                        "text-sm text-red-600"
-                    )
+            # One HTML element for all lines instead of a component per line
+            lines = [
+                f"Fetch Count: {stats['fetch_count']}",
+                f"Error Count: {stats['error_count']}",
+            ]
+            if stats["last_fetch_str"]:
+                lines.append(f"Last Fetch: {stats['last_fetch_str']}")
+            if stats["last_error_str"]:
+                lines.append(f"Last Error: {stats['last_error_str']}")
+            content = "".join(f"<div>{html.escape(line)}</div>" for line in lines)
+            if self._last_error:
+                error = html.escape(f"Error: {self._last_error}")
+                content += f'<div class="text-red-600">{error}</div>'
+
+            ui.html(content).classes("w-full flex flex-col gap-2 text-sm")
 
     def render_action_buttons(self) -> None:
         """Render action buttons for the module.
@@ -498,18 +613,21 @@ class ExtendedModule(Module):
                     "Clear Data", icon="delete", on_click=self._clear_data
                 ).classes("bg-red-500 text-white")
 
-    def _manual_refresh(self) -> None:
+    async def _manual_refresh(self) -> None:
         """Manual refresh handler.
 
-        Handle manual refresh requests from the UI.
+        Handle manual refresh requests from the UI. The fetch is awaited
+        so the event loop keeps serving other clients meanwhile.
         """
         try:
-            self.fetch()
-            self._notify_refresh()
-            ui.notify("Data refreshed successfully", type="positive")
+            await self.fetch_with_retry()
         except Exception as e:
-            self._handle_error(e)
+            # fetch_with_retry() already reported the error
             ui.notify(f"Failed to refresh: {str(e)}", type="negative")
+            return
+
+        self._notify_refresh()
+        ui.notify("Data refreshed successfully", type="positive")
 
     def _export_data(self) -> None:
         """Export data handler.
@@ -517,10 +635,12 @@ class ExtendedModule(Module):
         Handle data export requests from the UI.
         """
         try:
-            data = self.export_data()
+            # Serialize straight to bytes for the download instead of going
+            # through the str returned by export_data()
+            content = dumps_indented(self.fetch())
             # Create download link
             ui.download(
-                data,
+                content,
                 filename=f"{self.id}_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
             )
             ui.notify("Data exported successfully", type="positive")
@@ -1,37 +1,25 @@
 """GitHub module implementation."""
 
+import functools
 from typing import Any
 
 from nicegui import ui
 
 from ...ui.styles import DashboardStyles
-from ..extended import ExtendedModule
+from ..extended import ExtendedModule, open_in_new_tab
 
 
-class GithubModule(ExtendedModule):
-    @property
-    def id(self) -> str:
-        return "github"
-
-    @property
-    def name(self) -> str:
-        return "GitHub Activity"
-
-    @property
-    def icon(self) -> str:
-        return "🐙"
-
-    @property
-    def description(self) -> str:
-        return "Your recent GitHub activity"
+def _add_open_js(activity: dict[str, Any]) -> dict[str, Any]:
+    """Store the JavaScript that opens the activity's link in a new tab."""
+    activity["extra"]["open_js"] = f'window.open("{activity["link"]}", "_blank")'
+    return activity
 
-    @property
-    def version(self) -> str:
-        return "1.0.0"
 
-    def fetch(self) -> list[dict[str, Any]]:
-        # Placeholder implementation
-        return [
+# Placeholder activities; fetches return shallow copies
+_PLACEHOLDER_ACTIVITIES: tuple[dict[str, Any], ...] = tuple(
+    map(
+        _add_open_js,
+        (
             {
                 "title": "New commit in modular-dashboard",
                 "summary": "Added support for native desktop app mode",
@@ -56,6 +44,23 @@ class GithubModule(ExtendedModule):
                 "tags": ["pull-request", "arxiv-api"],
                 "extra": {"author": "contributor"},
             },
+        ),
+    )
+)
+
+
+class GithubModule(ExtendedModule):
+    id = "github"
+    name = "GitHub Activity"
+    icon = "🐙"
+    description = "Your recent GitHub activity"
+    version = "1.0.0"
+
+    def fetch(self) -> list[dict[str, Any]]:
+        # Placeholder implementation
+        return [
+            {**activity, "extra": {**activity["extra"]}}
+            for activity in _PLACEHOLDER_ACTIVITIES
         ]
 
     def render(self) -> None:
@@ -126,7 +131,7 @@ class GithubModule(ExtendedModule):
                 with ui.row().classes("w-full justify-end mt-2"):
                     ui.button(
                         "View on GitHub",
-                        on_click=lambda link=activity["link"]: ui.run_javascript(
-                            f'window.open("{link}", "_blank")'
+                        on_click=functools.partial(
+                            open_in_new_tab, activity["extra"]["open_js"]
                         ),
                     ).props("outline")
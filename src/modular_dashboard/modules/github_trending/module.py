@@ -1,178 +1,142 @@
 """GitHub Trending module implementation."""
 
-import json
+import functools
+import html
+import time
+from collections.abc import Callable, Mapping
 from datetime import datetime
-from typing import Any
-from urllib.request import urlopen
+from types import MappingProxyType
+from typing import Any, ClassVar
 
-from nicegui import ui
+import httpx
+from nicegui import app, background_tasks, ui
 
 from ...ui.styles import DashboardStyles
-from ..extended import ExtendedModule
-
-
-class GithubTrendingModule(ExtendedModule):
-    """GitHub Trending repositories module using OSS Insights API."""
-
-    @property
-    def id(self) -> str:
-        return "github_trending"
-
-    @property
-    def name(self) -> str:
-        return "GitHub Trending"
-
-    @property
-    def icon(self) -> str:
-        return "🔥"
-
-    @property
-    def description(self) -> str:
-        return "Trending GitHub repositories from OSS Insights"
-
-    @property
-    def version(self) -> str:
-        return "1.0.0"
-
-    @property
-    def category(self) -> str:
-        return "development"
-
-    @property
-    def supported_features(self) -> list[str]:
-        return ["trending_repos", "language_filter", "period_filter", "caching"]
-
-    def has_cache(self) -> bool:
-        """Module uses caching for API responses."""
-        return True
-
-    def get_default_config(self) -> dict[str, Any]:
-        """Get default configuration for the GitHub trending module."""
-        return {
-            "period": "weekly",
-            "language": "",
-            "limit": 10,
-            "cache_ttl": 3600,  # 1 hour cache
-        }
-
-    def get_config_schema(self) -> dict[str, Any]:
-        """Get configuration schema for UI generation."""
-        return {
-            "period": {
-                "type": "select",
-                "label": "Time Period",
-                "description": "Time period for trending repositories",
-                "default": "weekly",
-                "options": [
-                    {"label": "Daily", "value": "daily"},
-                    {"label": "Weekly", "value": "weekly"},
-                    {"label": "Monthly", "value": "monthly"},
-                ],
-            },
-            "language": {
-                "type": "string",
-                "label": "Programming Language",
-                "description": "Filter by programming language (leave empty for all)",
-                "default": "",
-            },
-            "limit": {
-                "type": "number",
-                "label": "Repository Limit",
-                "description": "Maximum number of repositories to display",
-                "default": 10,
-                "min": 1,
-                "max": 50,
-            },
-            "cache_ttl": {
-                "type": "number",
-                "label": "Cache TTL (seconds)",
-                "description": "How long to cache API responses",
-                "default": 3600,
-                "min": 300,
-                "max": 86400,
-            },
-        }
-
-    def fetch(self) -> list[dict[str, Any]]:
-        """Fetch trending repositories from OSS Insights API."""
-        period = self.config.get("period", "weekly")
-        language = self.config.get("language", "")
-        limit = self.config.get("limit", 10)
-        cache_ttl = self.config.get("cache_ttl", 3600)
-
-        # Try to get from cache first
-        cache = self.get_cache(cache_ttl)
-        cache_key = f"trending_{period}_{language}_{limit}"
-        cached_data = cache.get(cache_key)
-
-        if cached_data:
-            return cached_data
-
-        try:
-            # Build API URL
-            base_url = "https://api.ossinsight.io/v1/trends/repos/"
-            params = f"?period={period}"
-            if language:
-                params += f"&language={language}"
-
-            url = base_url + params
-
-            with urlopen(url) as response:
-                data = json.loads(response.read().decode())
-
-            # Process and cache the data
-            processed_data = self._process_api_response(data, limit)
-            cache.set(cache_key, processed_data)
-
-            return processed_data
-
-        except Exception:
-            # Return mock data on error
-            return self._get_mock_data(period, language, limit)
-
-    def _process_api_response(self, data: dict, limit: int) -> list[dict[str, Any]]:
-        """Process API response and return standardized format."""
-        repositories = []
-
-        if "data" in data and "rows" in data["data"]:
-            for repo in data["data"]["rows"][:limit]:
-                repositories.append(
-                    {
-                        "title": repo.get("repo_name", "Unknown Repository"),
-                        "summary": repo.get("description", "No description available"),
-                        "link": f"https://github.com/{repo.get('repo_name', '')}",
-                        "published": datetime.now().isoformat(),
-                        "tags": [
-                            repo.get("primary_language", "Unknown"),
-                            "trending",
-                        ],
-                        "extra": {
-                            "repo_name": repo.get("repo_name", ""),
-                            "primary_language": repo.get("primary_language", "Unknown"),
-                            "stars": repo.get("stars", 0),
-                            "forks": repo.get("forks", 0),
-                            "pull_requests": repo.get("pull_requests", 0),
-                            "contributor_logins": repo.get("contributor_logins", ""),
-                            "description": repo.get(
-                                "description", "No description available"
-                            ),
-                            "period": self.config.get("period", "weekly"),
-                        },
-                    }
-                )
-
-        return repositories
-
-    def _get_mock_data(
-        self, period: str, language: str, limit: int
-    ) -> list[dict[str, Any]]:
-        """Get mock data for testing or when API is unavailable."""
-        mock_repos = [
+from ...utils.json_utils import parse_response
+from ...utils.storage import CachedStorage
+from ..extended import ExtendedModule, open_in_new_tab
+
+_API_URL = "https://api.ossinsight.io/v1/trends/repos/"
+
+_DEFAULT_CONFIG: Mapping[str, Any] = MappingProxyType(
+    {
+        "period": "weekly",
+        "language": "",
+        "limit": 10,
+        "cache_ttl": 3600,  # 1 hour cache
+    }
+)
+
+_CONFIG_SCHEMA: Mapping[str, Any] = MappingProxyType(
+    {
+        "period": {
+            "type": "select",
+            "label": "Time Period",
+            "description": "Time period for trending repositories",
+            "default": "weekly",
+            "options": [
+                {"label": "Daily", "value": "daily"},
+                {"label": "Weekly", "value": "weekly"},
+                {"label": "Monthly", "value": "monthly"},
+            ],
+        },
+        "language": {
+            "type": "string",
+            "label": "Programming Language",
+            "description": "Filter by programming language (leave empty for all)",
+            "default": "",
+        },
+        "limit": {
+            "type": "number",
+            "label": "Repository Limit",
+            "description": "Maximum number of repositories to display",
+            "default": 10,
+            "min": 1,
+            "max": 50,
+        },
+        "cache_ttl": {
+            "type": "number",
+            "label": "Cache TTL (seconds)",
+            "description": "How long to cache API responses",
+            "default": 3600,
+            "min": 300,
+            "max": 86400,
+        },
+    }
+)
+
+# Bumped whenever the cached entry format changes, so stale entries miss
+_CACHE_FORMAT = 2
+
+# How long an expired entry is kept so it can be revalidated with a
+# conditional request instead of downloaded again
+_REVALIDATE_TTL = 7 * 24 * 3600
+
+# How long render() and render_detail() reuse the last cache lookup
+_RENDER_MEMO_SECONDS = 0.5
+
+
+def _conditional_headers(entry: dict[str, Any] | None) -> dict[str, str]:
+    """Build the revalidation headers for a previously cached entry."""
+    headers = {}
+    if entry is not None:
+        if entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+        if entry["last_modified"]:
+            headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+
+def _repo_from_row(row: dict[str, Any], period: str, published: str) -> dict[str, Any]:
+    """Convert one OSS Insight API row to the standard item format."""
+    get = row.get
+    repo_name = get("repo_name", "")
+    language = get("primary_language", "Unknown")
+    description = get("description", "No description available")
+    return {
+        "title": get("repo_name", "Unknown Repository"),
+        "summary": description,
+        "link": f"https://github.com/{repo_name}",
+        "published": published,
+        "tags": [language, "trending"],
+        "extra": {
+            "repo_name": repo_name,
+            "primary_language": language,
+            "stars": get("stars", 0),
+            "forks": get("forks", 0),
+            "pull_requests": get("pull_requests", 0),
+            "contributor_logins": get("contributor_logins", ""),
+            "description": description,
+            "period": period,
+        },
+    }
+
+
+def _add_display_fields(repo: dict[str, Any]) -> dict[str, Any]:
+    """Store the formatted counts and shortened texts shown by the views."""
+    extra = repo["extra"]
+    extra["stars_str"] = f"{extra['stars'] or 0:,}"
+    extra["forks_str"] = f"{extra['forks'] or 0:,}"
+    extra["pull_requests_str"] = f"{extra['pull_requests'] or 0:,}"
+    extra["summary_short"] = repo["summary"][:80] + "..." if repo["summary"] else ""
+    contributors = extra["contributor_logins"] or ""
+    extra["contributors_short"] = (
+        contributors[:50] + "..." if len(contributors) > 50 else contributors
+    )
+    extra["open_js"] = f'window.open("{repo["link"]}", "_blank")'
+    return repo
+
+
+# Mock repos served when the API is unavailable; each call returns shallow copies
+# with the publication time and period filled in.
+_MOCK_REPOS_BASE: tuple[dict[str, Any], ...] = tuple(
+    map(
+        _add_display_fields,
+        (
             {
                 "title": "microsoft/vscode",
                 "summary": "Visual Studio Code",
                 "link": "https://github.com/microsoft/vscode",
-                "published": datetime.now().isoformat(),
                 "tags": ["TypeScript", "trending"],
                 "extra": {
                     "repo_name": "microsoft/vscode",
@@ -182,14 +146,12 @@ class GithubTrendingModule(ExtendedModule):
                     "pull_requests": 1500,
                     "contributor_logins": "user1,user2,user3",
                     "description": "Visual Studio Code",
-                    "period": period,
                 },
             },
             {
                 "title": "facebook/react",
                 "summary": "A declarative, efficient, and flexible JavaScript library for building user interfaces.",
                 "link": "https://github.com/facebook/react",
-                "published": datetime.now().isoformat(),
                 "tags": ["JavaScript", "trending"],
                 "extra": {
                     "repo_name": "facebook/react",
@@ -199,14 +161,12 @@ class GithubTrendingModule(ExtendedModule):
                     "pull_requests": 2100,
                     "contributor_logins": "dev1,dev2,dev3",
                     "description": "A declarative, efficient, and flexible JavaScript library for building user interfaces.",
-                    "period": period,
                 },
             },
             {
                 "title": "tensorflow/tensorflow",
                 "summary": "An Open Source Machine Learning Framework for Everyone",
                 "link": "https://github.com/tensorflow/tensorflow",
-                "published": datetime.now().isoformat(),
                 "tags": ["C++", "trending"],
                 "extra": {
                     "repo_name": "tensorflow/tensorflow",
@@ -216,16 +176,327 @@ class GithubTrendingModule(ExtendedModule):
                     "pull_requests": 1800,
                     "contributor_logins": "ml1,ml2,ml3",
                     "description": "An Open Source Machine Learning Framework for Everyone",
-                    "period": period,
                 },
             },
+        ),
+    )
+)
+
+
+_CARD_CLS = (
+    f"{DashboardStyles.FULL_WIDTH} {DashboardStyles.PADDING_LG} "
+    f"{DashboardStyles.CARD_HOVER_EFFECT}"
+)
+_DETAIL_CARD_CLS = (
+    f"{DashboardStyles.FULL_WIDTH} {DashboardStyles.PADDING_LG} mb-4 "
+    f"{DashboardStyles.CARD_HOVER_EFFECT}"
+)
+_REPO_TITLE_CLS = (
+    DashboardStyles.TITLE_H2 + " hover-underline text-blue-600 dark:text-blue-400"
+)
+_STATS_ROW_CLS = (
+    f"flex flex-wrap {DashboardStyles.FLEX_BETWEEN} {DashboardStyles.GAP_MD} mt-2"
+)
+_STAT_CLS = f"flex {DashboardStyles.FLEX_CENTER} {DashboardStyles.GAP_SM}"
+_SUMMARY_CLS = DashboardStyles.TEXT_SECONDARY + " mt-2"
+_CONTRIBUTORS_CLS = DashboardStyles.TEXT_XS_MUTED + " mt-1"
+
+_STAR_HTML = f'<span class="{DashboardStyles.TEXT_MUTED}">⭐</span>'
+_FORK_HTML = f'<span class="{DashboardStyles.TEXT_MUTED}">🍴</span>'
+_PULL_REQUEST_HTML = f'<span class="{DashboardStyles.TEXT_MUTED}">🔄</span>'
+
+
+def _stat_html(icon_html: str, value: str) -> str:
+    """Build one icon-and-count entry of a repo card's stats row."""
+    return (
+        f'<div class="{_STAT_CLS}">{icon_html}'
+        f'<span class="{DashboardStyles.TEXT_SM_MEDIUM}">{value}</span></div>'
+    )
+
+
+def _repo_card_html(repo: dict[str, Any], detailed: bool) -> str:
+    """Build the HTML of a repo card: title, stats, summary and contributors."""
+    escape = html.escape
+    extra = repo["extra"]
+    parts = [
+        f'<a href="{escape(repo["link"])}" class="{DashboardStyles.LINK_NO_UNDERLINE}">'
+        f'<div class="{_REPO_TITLE_CLS}">{escape(repo["title"])}</div></a>'
+        f'<div class="{_STATS_ROW_CLS}">'
+    ]
+    if extra["primary_language"]:
+        parts.append(
+            f'<span class="{DashboardStyles.BADGE_BLUE}">'
+            f"{escape(extra['primary_language'])}</span>"
+        )
+    parts.append(_stat_html(_STAR_HTML, extra["stars_str"]))
+    parts.append(_stat_html(_FORK_HTML, extra["forks_str"]))
+    if detailed:
+        parts.append(_stat_html(_PULL_REQUEST_HTML, extra["pull_requests_str"]))
+    parts.append("</div>")
+
+    summary = repo["summary"] if detailed else extra["summary_short"]
+    if summary:
+        parts.append(f'<div class="{_SUMMARY_CLS}">{escape(summary)}</div>')
+    if detailed and extra["contributors_short"]:
+        contributors = escape(extra["contributors_short"])
+        parts.append(
+            f'<div class="{_CONTRIBUTORS_CLS}">Contributors: {contributors}</div>'
+        )
+    return "".join(parts)
+
+
+class GithubTrendingModule(ExtendedModule):
+    """GitHub Trending repositories module using OSS Insights API."""
+
+    id = "github_trending"
+    name = "GitHub Trending"
+    icon = "🔥"
+    description = "Trending GitHub repositories from OSS Insights"
+    version = "1.0.0"
+    category = "development"
+    supported_features = (
+        "trending_repos",
+        "language_filter",
+        "period_filter",
+        "caching",
+    )
+
+    # Shared by every instance; created on first async fetch and closed
+    # when the app shuts down
+    _async_client: ClassVar[httpx.AsyncClient | None] = None
+
+    def has_cache(self) -> bool:
+        """Module uses caching for API responses."""
+        return True
+
+    def get_default_config(self) -> dict[str, Any]:
+        """Get default configuration for the GitHub trending module."""
+        return dict(_DEFAULT_CONFIG)
+
+    def get_config_schema(self) -> Mapping[str, Any]:
+        """Get configuration schema for UI generation."""
+        return _CONFIG_SCHEMA
+
+    def __init__(self, config: dict[str, Any] | None = None):
+        super().__init__(config)
+        # Last cache lookup made while rendering: (monotonic time, cache key, entry)
+        self._render_cache: tuple[float, str, dict[str, Any] | None] | None = None
+
+    def _request_params(self) -> dict[str, str]:
+        """Return the API query parameters for the current configuration."""
+        params = {"period": self.config.get("period", "weekly")}
+        if language := self.config.get("language", ""):
+            params["language"] = language
+        return params
+
+    def _cache_key(self) -> str:
+        """Return the cache key for the current configuration."""
+        period = self.config.get("period", "weekly")
+        language = self.config.get("language", "")
+        limit = self.config.get("limit", 10)
+        return f"trending_v{_CACHE_FORMAT}_{period}_{language}_{limit}"
+
+    def _get_cached_entry(self) -> tuple[CachedStorage, str, dict[str, Any] | None]:
+        """Return the cache, the cache key and the stored entry, if any."""
+        cache = self.get_cache(self.config.get("cache_ttl", 3600))
+        cache_key = self._cache_key()
+        return cache, cache_key, cache.get(cache_key)
+
+    def _is_fresh(self, entry: dict[str, Any] | None) -> bool:
+        """Check whether a cached entry can be used without revalidating it."""
+        return entry is not None and time.time() - entry[
+            "fetched_at"
+        ] < self.config.get("cache_ttl", 3600)
+
+    @classmethod
+    def _get_async_client(cls) -> httpx.AsyncClient:
+        """Return the shared asynchronous HTTP client."""
+        if cls._async_client is None:
+            cls._async_client = httpx.AsyncClient(timeout=10.0)
+        return cls._async_client
+
+    def fetch(self) -> list[dict[str, Any]]:
+        """Fetch trending repositories from OSS Insights API.
+
+        Blocks for the HTTP round-trip when the cached entry is stale or
+        missing; code running on the event loop should prefer
+        :meth:`async_fetch`.
+        """
+        cache, cache_key, entry = self._get_cached_entry()
+        if self._is_fresh(entry):
+            return entry["data"]
+
+        return self._fetch_and_cache(cache, cache_key, entry)
+
+    async def async_fetch(self) -> list[dict[str, Any]]:
+        """Fetch trending repositories without blocking the event loop."""
+        cache, cache_key, entry = self._get_cached_entry()
+        if self._is_fresh(entry):
+            return entry["data"]
+
+        return await self.coalesce_async(
+            cache_key, lambda: self._async_fetch_and_cache(cache, cache_key, entry)
+        )
+
+    def _fetch_and_cache(
+        self, cache: CachedStorage, cache_key: str, entry: dict[str, Any] | None
+    ) -> list[dict[str, Any]]:
+        try:
+            response = self.get_http_client(_API_URL).get(
+                _API_URL,
+                params=self._request_params(),
+                headers=_conditional_headers(entry),
+            )
+            return self._store_response(cache, cache_key, entry, response)
+
+        except Exception:
+            # Serve the expired repos, or mock data if nothing was cached
+            if entry is not None:
+                return entry["data"]
+            return self._get_fallback_data()
+
+    async def _async_fetch_and_cache(
+        self, cache: CachedStorage, cache_key: str, entry: dict[str, Any] | None
+    ) -> list[dict[str, Any]]:
+        try:
+            response = await self._get_async_client().get(
+                _API_URL,
+                params=self._request_params(),
+                headers=_conditional_headers(entry),
+            )
+            return self._store_response(cache, cache_key, entry, response)
+
+        except Exception:
+            # Serve the expired repos, or mock data if nothing was cached
+            if entry is not None:
+                return entry["data"]
+            return self._get_fallback_data()
+
+    def _store_response(
+        self,
+        cache: CachedStorage,
+        cache_key: str,
+        entry: dict[str, Any] | None,
+        response: httpx.Response,
+    ) -> list[dict[str, Any]]:
+        """Cache the repositories from a response along with its validators.
+
+        A 304 response renews the previously cached repositories without
+        parsing anything.
+        """
+        headers = response.headers
+        if response.status_code == 304 and entry is not None:
+            data = entry["data"]
+            etag = headers.get("etag", entry["etag"])
+            last_modified = headers.get("last-modified", entry["last_modified"])
+        else:
+            data = self._process_http_response(response)
+            etag = headers.get("etag")
+            last_modified = headers.get("last-modified")
+
+        cache.set(
+            cache_key,
+            {
+                "data": data,
+                "etag": etag,
+                "last_modified": last_modified,
+                "fetched_at": time.time(),
+            },
+            ttl=_REVALIDATE_TTL,
+        )
+        return data
+
+    def _get_render_entry(self) -> dict[str, Any] | None:
+        """Return the cached entry, reusing the lookup from the same render pass."""
+        now = time.monotonic()
+        cache_key = self._cache_key()
+        cached = self._render_cache
+        if (
+            cached is not None
+            and cached[1] == cache_key
+            and now - cached[0] < _RENDER_MEMO_SECONDS
+        ):
+            return cached[2]
+
+        entry = self._get_cached_entry()[2]
+        self._render_cache = (now, cache_key, entry)
+        return entry
+
+    def _process_http_response(self, response: httpx.Response) -> list[dict[str, Any]]:
+        """Check an API response and return its repositories."""
+        response.raise_for_status()
+        return self._process_api_response(
+            parse_response(response), self.config.get("limit", 10)
+        )
+
+    def _get_fallback_data(self) -> list[dict[str, Any]]:
+        """Get mock data matching the current configuration."""
+        return self._get_mock_data(
+            self.config.get("period", "weekly"),
+            self.config.get("language", ""),
+            self.config.get("limit", 10),
+        )
+
+    def _process_api_response(self, data: dict, limit: int) -> list[dict[str, Any]]:
+        """Process API response and return standardized format."""
+        rows = data.get("data", {}).get("rows", [])[:limit]
+        period = self.config.get("period", "weekly")
+        now_iso = datetime.now().isoformat()
+        return [
+            _add_display_fields(_repo_from_row(row, period, now_iso)) for row in rows
         ]
 
-        return mock_repos[:limit]
+    def _get_mock_data(
+        self, period: str, language: str, limit: int
+    ) -> list[dict[str, Any]]:
+        """Get mock data for testing or when API is unavailable."""
+        now_iso = datetime.now().isoformat()
+        return [
+            {**base, "published": now_iso, "extra": {**base["extra"], "period": period}}
+            for base in _MOCK_REPOS_BASE[:limit]
+        ]
 
     def render(self) -> None:
         """Render the GitHub trending module UI."""
-        data = self.fetch()
+        self._render_with_refresh(self._render_main)
+
+    def render_detail(self) -> None:
+        """Render detailed view of trending repositories."""
+        self._render_with_refresh(self._render_detail_content)
+
+    def _render_with_refresh(
+        self, render_content: Callable[[list[dict[str, Any]] | None], None]
+    ) -> None:
+        """Render from cached repos and refresh them in the background.
+
+        The page never waits on the API: stale or missing repos are fetched
+        with :meth:`async_fetch` after the page is built, and the content is
+        re-rendered in place once they arrive.
+        """
+        entry = self._get_render_entry()
+        container = ui.element().classes("w-full")
+        with container:
+            render_content(entry["data"] if entry is not None else None)
+
+        if self._is_fresh(entry):
+            return
+
+        async def refresh() -> None:
+            data = await self.async_fetch()
+            if container.is_deleted:
+                return
+            container.clear()
+            with container:
+                render_content(data)
+
+        background_tasks.create(refresh(), name=f"{self.id}_refresh")
+
+    def _render_main(self, data: list[dict[str, Any]] | None) -> None:
+        if data is None:
+            ui.label("Loading trending repositories...").classes(
+                DashboardStyles.TEXT_MUTED
+            )
+            return
 
         if not data:
             ui.label("No trending repositories available").classes(
@@ -234,58 +505,14 @@ class GithubTrendingModule(ExtendedModule):
             return
 
         # Show only the first repository in the main view
-        repo = data[0]
-        extra = repo.get("extra", {})
-
-        with ui.card().classes(
-            f"{DashboardStyles.FULL_WIDTH} {DashboardStyles.PADDING_LG} {DashboardStyles.CARD_HOVER_EFFECT}"
-        ):
-            # Repository name with link
-            with ui.link(target=repo["link"]).classes(
-                DashboardStyles.LINK_NO_UNDERLINE
-            ):
-                ui.label(repo["title"]).classes(
-                    DashboardStyles.TITLE_H2
-                    + " hover-underline text-blue-600 dark:text-blue-400"
-                )
-
-            # Language and stats
-            with ui.row().classes(
-                f"{DashboardStyles.FLEX_BETWEEN} {DashboardStyles.GAP_MD} mt-2"
-            ):
-                # Language
-                if extra.get("primary_language"):
-                    ui.chip(extra["primary_language"]).classes(
-                        DashboardStyles.BADGE_BLUE
-                    )
-
-                # Stars
-                with ui.row().classes(
-                    f"{DashboardStyles.FLEX_CENTER} {DashboardStyles.GAP_SM}"
-                ):
-                    ui.label("⭐").classes(DashboardStyles.TEXT_MUTED)
-                    ui.label(f"{extra.get('stars', 0):,}").classes(
-                        DashboardStyles.TEXT_SM_MEDIUM
-                    )
-
-                # Forks
-                with ui.row().classes(
-                    f"{DashboardStyles.FLEX_CENTER} {DashboardStyles.GAP_SM}"
-                ):
-                    ui.label("🍴").classes(DashboardStyles.TEXT_MUTED)
-                    ui.label(f"{extra.get('forks', 0):,}").classes(
-                        DashboardStyles.TEXT_SM_MEDIUM
-                    )
-
-            # Description
-            if repo.get("summary"):
-                ui.label(repo["summary"][:80] + "...").classes(
-                    DashboardStyles.TEXT_SECONDARY + " mt-2"
-                )
+        self._render_repo_card(data[0], detailed=False)
 
-    def render_detail(self) -> None:
-        """Render detailed view of trending repositories."""
-        data = self.fetch()
+    def _render_detail_content(self, data: list[dict[str, Any]] | None) -> None:
+        if data is None:
+            ui.label("Loading trending repositories...").classes(
+                DashboardStyles.TEXT_MUTED + " text-center w-full"
+            )
+            return
 
         if not data:
             ui.label("No trending repositories available").classes(
@@ -307,79 +534,36 @@ class GithubTrendingModule(ExtendedModule):
 
         # Render all repositories
         for repo in data:
-            extra = repo.get("extra", {})
-
-            with ui.card().classes(
-                f"{DashboardStyles.FULL_WIDTH} {DashboardStyles.PADDING_LG} mb-4 {DashboardStyles.CARD_HOVER_EFFECT}"
-            ):
-                # Repository name with link
-                with ui.link(target=repo["link"]).classes(
-                    DashboardStyles.LINK_NO_UNDERLINE
-                ):
-                    ui.label(repo["title"]).classes(
-                        DashboardStyles.TITLE_H2
-                        + " hover-underline text-blue-600 dark:text-blue-400"
-                    )
-
-                # Stats row
-                with ui.row().classes(
-                    f"{DashboardStyles.FLEX_BETWEEN} {DashboardStyles.GAP_MD} mt-2"
-                ):
-                    # Language
-                    if extra.get("primary_language"):
-                        ui.chip(extra["primary_language"]).classes(
-                            DashboardStyles.BADGE_BLUE
-                        )
-
-                    # Stars
-                    with ui.row().classes(
-                        f"{DashboardStyles.FLEX_CENTER} {DashboardStyles.GAP_SM}"
-                    ):
-                        ui.label("⭐").classes(DashboardStyles.TEXT_MUTED)
-                        ui.label(f"{extra.get('stars', 0):,}").classes(
-                            DashboardStyles.TEXT_SM_MEDIUM
-                        )
-
-                    # Forks
-                    with ui.row().classes(
-                        f"{DashboardStyles.FLEX_CENTER} {DashboardStyles.GAP_SM}"
-                    ):
-                        ui.label("🍴").classes(DashboardStyles.TEXT_MUTED)
-                        ui.label(f"{extra.get('forks', 0):,}").classes(
-                            DashboardStyles.TEXT_SM_MEDIUM
-                        )
-
-                    # Pull requests
-                    with ui.row().classes(
-                        f"{DashboardStyles.FLEX_CENTER} {DashboardStyles.GAP_SM}"
-                    ):
-                        ui.label("🔄").classes(DashboardStyles.TEXT_MUTED)
-                        ui.label(f"{extra.get('pull_requests', 0):,}").classes(
-                            DashboardStyles.TEXT_SM_MEDIUM
-                        )
-
-                # Description
-                if repo.get("summary"):
-                    ui.label(repo["summary"]).classes(
-                        DashboardStyles.TEXT_SECONDARY + " mt-2"
-                    )
-
-                # Contributors
-                if extra.get("contributor_logins"):
-                    contributors = (
-                        extra["contributor_logins"][:50] + "..."
-                        if len(extra["contributor_logins"]) > 50
-                        else extra["contributor_logins"]
-                    )
-                    ui.label(f"Contributors: {contributors}").classes(
-                        DashboardStyles.TEXT_XS_MUTED + " mt-1"
-                    )
+            self._render_repo_card(repo, detailed=True)
+
+    def _render_repo_card(self, repo: dict[str, Any], detailed: bool) -> None:
+        """Render one repository card; the detail view adds more fields."""
+        with ui.card().classes(_DETAIL_CARD_CLS if detailed else _CARD_CLS):
+            # Everything but the button is static, so it is sent as a single
+            # HTML element instead of a component per label and row
+            ui.html(_repo_card_html(repo, detailed)).classes("w-full")
 
+            if detailed:
                 # Action button
                 with ui.row().classes(f"{DashboardStyles.FULL_WIDTH} justify-end mt-2"):
                     ui.button(
                         "View on GitHub",
-                        on_click=lambda link=repo["link"]: ui.run_javascript(
-                            f'window.open("{link}", "_blank")'
+                        on_click=functools.partial(
+                            open_in_new_tab, repo["extra"]["open_js"]
                         ),
                     ).props("outline").classes(DashboardStyles.BUTTON_OUTLINE)
+
+
+async def _close_async_client() -> None:
+    """Close the shared async client when the app shuts down.
+
+    The client is shared by every instance, so it is closed once for the
+    whole app rather than from any single module's shutdown().
+    """
+    client = GithubTrendingModule._async_client
+    GithubTrendingModule._async_client = None
+    if client is not None:
+        await client.aclose()
+
+
+app.on_shutdown(_close_async_client)
@@ -6,6 +6,22 @@ import pickle
 import sys
 from typing import Any
 
+try:
+    import zstandard
+
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+# One-byte codec marker prepended to every payload so reads can branch
+# without trying each decompressor in turn
+_RAW = b"\x00"
+_GZIP = b"\x01"
+_ZSTD = b"\x02"
+
+# Zstandard level 3 compresses several times faster than gzip at a similar ratio
+_ZSTD_LEVEL = 3
+
 
 class CompressedCacheEntry:
     """Represents a compressed cache entry."""
@@ -21,7 +37,12 @@ class CompressedCacheEntry:
 
 
 class CompressedCache:
-    """Cache with compression support for large objects."""
+    """Cache with compression support for large objects.
+
+    Payloads smaller than ``compression_threshold`` bytes once serialized are
+    stored raw; larger ones are compressed with Zstandard when available and
+    gzip otherwise.
+    """
 
     def __init__(
         self,
@@ -32,6 +53,11 @@ class CompressedCache:
         self.compression_threshold = compression_threshold
         self.compression_level = compression_level
         self.max_entry_size = max_entry_size
+        # Compressor contexts are expensive to set up, so build one per cache
+        self._zstd_compressor = (
+            zstandard.ZstdCompressor(level=_ZSTD_LEVEL) if HAS_ZSTD else None
+        )
+        self._zstd_decompressor = zstandard.ZstdDecompressor() if HAS_ZSTD else None
 
     def should_compress(self, obj: Any) -> bool:
         """Check if object should be compressed based on size."""
@@ -41,19 +67,46 @@ class CompressedCache:
         except (TypeError, ValueError):
             return False
 
+    def _serialize(self, obj: Any) -> bytes:
+        """Serialize object to bytes."""
+        return pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _deserialize(self, data: bytes) -> Any:
+        """Deserialize object from bytes."""
+        return pickle.loads(data)
+
     def compress(self, obj: Any) -> CompressedCacheEntry:
-        """Compress object using pickle and gzip."""
-        serialized = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+        """Serialize object and compress it if it exceeds the threshold."""
+        serialized = self._serialize(obj)
         original_size = len(serialized)
 
-        compressed = gzip.compress(serialized, compresslevel=self.compression_level)
+        if original_size < self.compression_threshold:
+            # Not worth the compressor's CPU time
+            compressed = _RAW + serialized
+        elif self._zstd_compressor is not None:
+            compressed = _ZSTD + self._zstd_compressor.compress(serialized)
+        else:
+            compressed = _GZIP + gzip.compress(
+                serialized, compresslevel=self.compression_level
+            )
 
         return CompressedCacheEntry(obj, compressed, original_size)
 
     def decompress(self, compressed_entry: CompressedCacheEntry) -> Any:
         """Decompress object."""
-        decompressed = gzip.decompress(compressed_entry.compressed_data)
-        return pickle.loads(decompressed)
+        data = compressed_entry.compressed_data
+        marker, payload = data[:1], data[1:]
+
+        if marker == _ZSTD:
+            if self._zstd_decompressor is None:
+                raise ValueError("zstandard is required to decompress this entry")
+            payload = self._zstd_decompressor.decompress(payload)
+        elif marker == _GZIP:
+            payload = gzip.decompress(payload)
+        elif marker != _RAW:
+            raise ValueError(f"Unknown compression marker: {marker!r}")
+
+        return self._deserialize(payload)
 
     def estimate_size(self, obj: Any) -> int:
         """Estimate serialized size of object."""
@@ -66,27 +119,27 @@ class CompressedCache:
 class JsonCompressedCache(CompressedCache):
     """Compressed cache optimized for JSON-serializable objects."""
 
-    def compress(self, obj: Any) -> CompressedCacheEntry:
-        """Compress JSON-serializable object."""
-        serialized = json.dumps(obj, ensure_ascii=False).encode("utf-8")
-        original_size = len(serialized)
-
-        compressed = gzip.compress(serialized, compresslevel=self.compression_level)
-
-        return CompressedCacheEntry(obj, compressed, original_size)
+    def _serialize(self, obj: Any) -> bytes:
+        """Serialize JSON-serializable object to UTF-8 bytes."""
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
 
-    def decompress(self, compressed_entry: CompressedCacheEntry) -> Any:
-        """Decompress JSON object."""
-        decompressed = gzip.decompress(compressed_entry.compressed_data)
-        return json.loads(decompressed.decode("utf-8"))
+    def _deserialize(self, data: bytes) -> Any:
+        """Deserialize JSON object from UTF-8 bytes."""
+        return json.loads(data.decode("utf-8"))
 
 
 class MemoryEfficientCache:
     """Memory-efficient cache with compression and size limits."""
 
-    def __init__(self, max_size_mb: int = 50, compression_threshold: int = 1024):
+    def __init__(
+        self,
+        max_size_mb: int = 50,
+        compression_threshold: int = 1024,
+        enable_compression: bool = True,
+    ):
         self.max_size_bytes = max_size_mb * 1024 * 1024
         self.compression_threshold = compression_threshold
+        self.enable_compression = enable_compression
         self._cache: dict[str, Any] = {}
         self._sizes: dict[str, int] = {}
         self._total_size = 0
@@ -114,17 +167,19 @@ class MemoryEfficientCache:
         estimated_size = self.compressor.estimate_size(value)
 
         # Check if we need to compress
-        if estimated_size >= self.compression_threshold:
+        entry = value
+        actual_size = estimated_size
+        if self.enable_compression and estimated_size >= self.compression_threshold:
             try:
                 compressed = self.compressor.compress(value)
+            except Exception:
+                compressed = None
+
+            # Payloads below the threshold once serialized come back raw;
+            # keep the original object rather than a pickled copy of it
+            if compressed is not None and compressed.compressed_data[:1] != _RAW:
                 entry = compressed
                 actual_size = compressed.compressed_size
-            except Exception:
-                entry = value
-                actual_size = estimated_size
-        else:
-            entry = value
-            actual_size = estimated_size
 
         # Ensure we have space
         while self._total_size + actual_size > self.max_size_bytes and self._cache:
@@ -0,0 +1,33 @@
+"""JSON helpers that use orjson when it is installed."""
+
+import json
+from typing import TYPE_CHECKING, Any
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+if TYPE_CHECKING:
+    import httpx
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse a JSON document."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_indented(obj: Any) -> bytes:
+    """Serialize to UTF-8 encoded JSON indented by two spaces."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+
+
+def parse_response(response: "httpx.Response") -> Any:
+    """Decode a JSON response body straight from its bytes."""
+    return loads(response.content)
@@ -64,6 +64,12 @@ class LazyModuleWrapper:
                         raise e
         return self._instance
 
+    def set_instance(self, instance: "Module") -> None:
+        """Adopt an already-constructed instance instead of creating one lazily."""
+        with self._lock:
+            if self._instance is None:
+                self._instance = instance
+
     def is_initialized(self) -> bool:
         """Check if the module has been initialized."""
         return self._instance is not None
@@ -94,6 +100,16 @@ class ModuleCache:
                     self._cache[module_id] = LazyModuleWrapper(module_class, config)
         return self._cache[module_id]
 
+    def preload(
+        self,
+        module_id: str,
+        module_class: type["Module"],
+        config: dict[str, Any],
+        instance: "Module",
+    ) -> None:
+        """Register an already-constructed instance so rendering reuses it."""
+        self.get_or_create(module_id, module_class, config).set_instance(instance)
+
     def get_instance(self, module_id: str) -> Optional["Module"]:
         """Get the actual module instance if it exists."""
         wrapper = self._cache.get(module_id)